@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from pathlib import Path
 
@@ -12,6 +11,7 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+from . import jsonio
 from .parsers import (
     parse_claude_sessions,
     parse_codex_sessions,
@@ -19,7 +19,7 @@ from .parsers import (
     parse_gemini_sessions,
 )
 from .parsers.base import AgentType, Session
-from .stats import WrappedStats, aggregate_stats
+from .stats import WrappedStats, aggregate_stats, top_counts
 from .enrichment import (
     compute_archetype_profile,
     compute_fingerprint,
@@ -213,7 +213,7 @@ def print_summary(stats: WrappedStats) -> None:
     # Top repos
     if stats.all_repos:
         console.print("[bold]Top Repositories:[/bold]")
-        for repo, count in sorted(stats.all_repos.items(), key=lambda x: x[1], reverse=True)[:5]:
+        for repo, count in top_counts(stats.all_repos, 5).items():
             console.print(f"  {repo}: {count} sessions")
         console.print()
 
@@ -319,8 +319,7 @@ def run(year: int, output: str | None, verbose: bool, narrate: bool, no_report:
 
     # Save JSON stats
     json_path = output_dir / f"wrapped-{year}.json"
-    with open(json_path, "w") as f:
-        json.dump(stats.to_dict(), f, indent=2)
+    json_path.write_bytes(jsonio.dumps(stats.to_dict(), indent=True))
 
     console.print(f"\n[dim]Stats saved to: {json_path}[/dim]")
 
@@ -12,8 +12,9 @@ Categorizes user prompts into personality types based on their intent:
 from __future__ import annotations
 
 import re
-from collections import defaultdict
+from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -126,6 +127,25 @@ ARCHETYPE_DISPLAY: dict[str, tuple[str, str, str]] = {
 }
 
 
+# Single-word patterns made only of word characters map straight to their
+# archetype, so a prompt is scored in one pass over its words; phrases and the
+# rest (e.g. "can't") are checked separately, the latter with a precompiled
+# word-boundary regex
+_WORD_RE = re.compile(r"\w+")
+_WORD_ARCHETYPES: dict[str, str] = {
+    pattern: archetype
+    for archetype, patterns in ARCHETYPE_PATTERNS.items()
+    for pattern in patterns
+    if _WORD_RE.fullmatch(pattern)
+}
+_OTHER_PATTERNS: list[tuple[str, str, re.Pattern[str] | None]] = [
+    (pattern, archetype, None if " " in pattern else re.compile(rf"\b{re.escape(pattern)}\b"))
+    for archetype, patterns in ARCHETYPE_PATTERNS.items()
+    for pattern in patterns
+    if pattern not in _WORD_ARCHETYPES
+]
+
+
 @dataclass
 class ArchetypeScore:
     """Score for a single archetype."""
@@ -149,9 +169,13 @@ class ArchetypeProfile:
     total_prompts: int
 
 
+@lru_cache(maxsize=4096)
 def classify_prompt(text: str) -> str | None:
     """Classify a single prompt into an archetype.
 
+    Results are cached: short prompts ("continue", "fix it", "run the
+    tests") repeat often across sessions.
+
     Args:
         text: The prompt text
 
@@ -164,27 +188,26 @@ def classify_prompt(text: str) -> str | None:
     text_lower = text.lower()
 
     # Score each archetype
-    archetype_scores: dict[str, int] = defaultdict(int)
-
-    for archetype, patterns in ARCHETYPE_PATTERNS.items():
-        for pattern in patterns:
-            if " " in pattern:
-                # Multi-word phrase
-                if pattern in text_lower:
-                    archetype_scores[archetype] += 2  # Phrases worth more
-            else:
-                # Single word with word boundaries
-                regex = rf"\b{re.escape(pattern)}\b"
-                matches = len(re.findall(regex, text_lower))
-                archetype_scores[archetype] += matches
-
-    if not archetype_scores:
-        return None
-
-    # Return archetype with highest score
-    best = max(archetype_scores.items(), key=lambda x: x[1])
-    if best[1] > 0:
-        return best[0]
+    archetype_scores: Counter[str] = Counter()
+
+    for word in _WORD_RE.findall(text_lower):
+        archetype = _WORD_ARCHETYPES.get(word)
+        if archetype is not None:
+            archetype_scores[archetype] += 1
+
+    for pattern, archetype, regex in _OTHER_PATTERNS:
+        if regex is None:
+            # Multi-word phrase
+            if pattern in text_lower:
+                archetype_scores[archetype] += 2  # Phrases worth more
+        else:
+            # Single word with word boundaries
+            archetype_scores[archetype] += len(regex.findall(text_lower))
+
+    # Return archetype with highest score (ties go to the earlier archetype)
+    best = max(ARCHETYPE_PATTERNS, key=archetype_scores.__getitem__)
+    if archetype_scores[best] > 0:
+        return best
 
     return None
 
@@ -195,14 +218,7 @@ def classify_session_prompts(session: Session) -> dict[str, int]:
     Returns:
         Dict mapping archetype names to counts
     """
-    counts: dict[str, int] = defaultdict(int)
-
-    for prompt in session.user_prompts:
-        archetype = classify_prompt(prompt)
-        if archetype:
-            counts[archetype] += 1
-
-    return dict(counts)
+    return dict(Counter(filter(None, map(classify_prompt, session.user_prompts))))
 
 
 def compute_archetype_profile(sessions: list[Session]) -> ArchetypeProfile | None:
@@ -212,14 +228,12 @@ def compute_archetype_profile(sessions: list[Session]) -> ArchetypeProfile | Non
         ArchetypeProfile with primary, secondary, and all archetype scores
     """
     # Aggregate counts across all sessions
-    total_counts: dict[str, int] = defaultdict(int)
+    total_counts: Counter[str] = Counter()
     total_prompts = 0
 
     for session in sessions:
         total_prompts += len(session.user_prompts)
-        session_counts = classify_session_prompts(session)
-        for archetype, count in session_counts.items():
-            total_counts[archetype] += count
+        total_counts.update(filter(None, map(classify_prompt, session.user_prompts)))
 
     if not total_counts:
         return None
@@ -228,7 +242,7 @@ def compute_archetype_profile(sessions: list[Session]) -> ArchetypeProfile | Non
 
     # Build scores list
     all_scores: list[ArchetypeScore] = []
-    for archetype, count in sorted(total_counts.items(), key=lambda x: x[1], reverse=True):
+    for archetype, count in total_counts.most_common():
         display_name, emoji, description = ARCHETYPE_DISPLAY.get(
             archetype, (archetype.title(), "🎯", "")
         )
@@ -10,6 +10,10 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from ..stats import WEEKEND_MASK
+
 if TYPE_CHECKING:
     from ..stats import WrappedStats
 
@@ -17,6 +21,12 @@ if TYPE_CHECKING:
 # 12 award types: night_owl, early_bird, bug_slayer, marathon_coder, speed_demon,
 # streak_master, repo_hopper, deep_diver, ai_whisperer, polyglot, weekend_warrior, terminal_master
 
+LATE_NIGHT_HOURS = (23, 0, 1, 2, 3, 4)
+EARLY_HOURS = (5, 6, 7, 8)
+
+# Bug Slayer needs more than this many sessions before vibes are scanned
+BUG_SLAYER_MIN_SESSIONS = 10
+
 
 @dataclass
 class Award:
@@ -42,14 +52,13 @@ def detect_awards(stats: WrappedStats) -> list[Award]:
     awards: list[Award] = []
 
     # Night Owl: Peak hour between 11pm-4am
-    late_night_hours = [23, 0, 1, 2, 3, 4]
     late_night_count = sum(
-        stats.hours_distribution.get(h, 0) for h in late_night_hours
+        stats.hours_distribution.get(h, 0) for h in LATE_NIGHT_HOURS
     )
     total_sessions = stats.total_sessions
     if total_sessions > 0 and late_night_count / total_sessions > 0.15:
         peak_late = max(
-            late_night_hours,
+            LATE_NIGHT_HOURS,
             key=lambda h: stats.hours_distribution.get(h, 0),
         )
         awards.append(
@@ -64,8 +73,7 @@ def detect_awards(stats: WrappedStats) -> list[Award]:
         )
 
     # Early Bird: Peak hour between 5am-8am
-    early_hours = [5, 6, 7, 8]
-    early_count = sum(stats.hours_distribution.get(h, 0) for h in early_hours)
+    early_count = sum(stats.hours_distribution.get(h, 0) for h in EARLY_HOURS)
     if total_sessions > 0 and early_count / total_sessions > 0.15:
         awards.append(
             Award(
@@ -164,17 +172,22 @@ def detect_awards(stats: WrappedStats) -> list[Award]:
         )
 
     # Weekend Warrior: High weekend ratio
-    weekend_count = 0
-    weekday_count = 0
-    for date_str, count in stats.daily_sessions.items():
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-            if date.weekday() >= 5:  # Saturday = 5, Sunday = 6
+    if stats.sessions:
+        is_weekend = (WEEKEND_MASK >> stats.columns.day_of_week) & 1
+        weekend_count = int(is_weekend.sum())
+        weekday_count = len(is_weekend) - weekend_count
+    else:
+        weekend_count = 0
+        weekday_count = 0
+        for date_str, count in stats.daily_sessions.items():
+            try:
+                weekday = datetime.strptime(date_str, "%Y-%m-%d").weekday()
+            except ValueError:
+                continue
+            if (WEEKEND_MASK >> weekday) & 1:
                 weekend_count += count
             else:
                 weekday_count += count
-        except ValueError:
-            continue
 
     if weekend_count + weekday_count > 0:
         weekend_ratio = weekend_count / (weekend_count + weekday_count)
@@ -205,8 +218,9 @@ def detect_awards(stats: WrappedStats) -> list[Award]:
             )
         )
 
-    # Bug Slayer: High ratio of debugging sessions (based on vibe detection)
-    if stats.sessions:
+    # Bug Slayer: High ratio of debugging sessions (based on vibe detection).
+    # Vibe detection is the costliest check here, so skip it for small years.
+    if stats.sessions and total_sessions > BUG_SLAYER_MIN_SESSIONS:
         from .vibes import detect_session_vibe
 
         debugging_sessions = 0
@@ -215,7 +229,7 @@ def detect_awards(stats: WrappedStats) -> list[Award]:
             if vibe and vibe.vibe == "debugging_hell":
                 debugging_sessions += 1
 
-        if total_sessions > 10 and debugging_sessions / total_sessions > 0.25:
+        if debugging_sessions / total_sessions > 0.25:
             awards.append(
                 Award(
                     id="bug_slayer",
@@ -229,11 +243,11 @@ def detect_awards(stats: WrappedStats) -> list[Award]:
 
     # Speed Demon: Many fast, productive sessions
     if stats.sessions:
-        fast_sessions = 0
-        for session in stats.sessions:
-            # Fast = under 15 minutes but at least 5 turns (not trivial)
-            if session.duration_minutes < 15 and session.turn_count >= 5:
-                fast_sessions += 1
+        # Fast = under 15 minutes but at least 5 turns (not trivial)
+        columns = stats.columns
+        fast_sessions = int(
+            np.count_nonzero((columns.duration_minutes < 15) & (columns.turn_count >= 5))
+        )
 
         if total_sessions > 20 and fast_sessions / total_sessions > 0.3:
             awards.append(
@@ -6,7 +6,12 @@ Assigns personality labels based on tool usage patterns.
 
 from __future__ import annotations
 
+from collections import Counter
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import lru_cache
+from heapq import nlargest
+from operator import itemgetter
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -54,6 +59,15 @@ COMBO_FINGERPRINTS: list[tuple[set[str], str, str]] = [
 ]
 
 
+# TOOL_CATEGORIES lowercased once, with case variants ("Bash"/"bash") merged.
+# Keywords match as substrings in order (e.g. "TodoWrite" is an editor tool),
+# so they stay ordered tuples rather than sets
+_CATEGORY_KEYWORDS: tuple[tuple[str, tuple[str, ...]], ...] = tuple(
+    (category, tuple(dict.fromkeys(keyword.lower() for keyword in keywords)))
+    for category, keywords in TOOL_CATEGORIES.items()
+)
+
+
 @dataclass
 class ToolUsage:
     """Usage statistics for a single tool."""
@@ -87,17 +101,18 @@ class Fingerprint:
     raw_counts: dict[str, int]
 
 
+@lru_cache(maxsize=256)
 def categorize_tool(tool_name: str) -> str | None:
-    """Map a tool name to its category.
+    """Map a tool name to its category (cached: tool names form a small set).
 
     Returns:
         Category name or None if uncategorized
     """
     tool_lower = tool_name.lower()
 
-    for category, keywords in TOOL_CATEGORIES.items():
+    for category, keywords in _CATEGORY_KEYWORDS:
         for keyword in keywords:
-            if keyword.lower() in tool_lower:
+            if keyword in tool_lower:
                 return category
 
     return None
@@ -109,39 +124,45 @@ def compute_fingerprint(sessions: list[Session]) -> Fingerprint | None:
     Returns:
         Fingerprint with personality and usage breakdown
     """
-    # Aggregate tool usage
-    tool_counts: dict[str, int] = {}
-    for session in sessions:
-        for tool, count in session.tools_used.items():
-            tool_counts[tool] = tool_counts.get(tool, 0) + count
+    # Aggregate tool usage; a single session's counts are already the totals
+    tool_counts: Mapping[str, int]
+    if len(sessions) == 1:
+        tool_counts = sessions[0].tools_used
+    else:
+        tool_counts = Counter()
+        for session in sessions:
+            tool_counts.update(session.tools_used)
 
     if not tool_counts:
         return None
 
+    return _build_fingerprint(tool_counts)
+
+
+def _build_fingerprint(tool_counts: Mapping[str, int]) -> Fingerprint:
+    """Categorize aggregated tool counts and pick a personality."""
     total = sum(tool_counts.values())
 
     # Compute category totals
-    category_counts: dict[str, int] = {}
-    category_tools: dict[str, dict[str, int]] = {}
+    category_counts: Counter[str] = Counter()
+    category_tools: dict[str, Counter[str]] = {}
 
     for tool, count in tool_counts.items():
         category = categorize_tool(tool)
         if category:
-            category_counts[category] = category_counts.get(category, 0) + count
-            if category not in category_tools:
-                category_tools[category] = {}
-            category_tools[category][tool] = count
+            category_counts[category] += count
+            category_tools.setdefault(category, Counter())[tool] = count
 
     # Build category usage objects
     categories: list[CategoryUsage] = []
-    for category, count in sorted(category_counts.items(), key=lambda x: x[1], reverse=True):
+    for category, count in category_counts.most_common():
         tools = [
             ToolUsage(
                 name=t,
                 count=c,
                 percentage=(c / total) * 100,
             )
-            for t, c in sorted(category_tools[category].items(), key=lambda x: x[1], reverse=True)
+            for t, c in category_tools[category].most_common()
         ]
         categories.append(
             CategoryUsage(
@@ -159,7 +180,7 @@ def compute_fingerprint(sessions: list[Session]) -> Fingerprint | None:
             count=c,
             percentage=(c / total) * 100,
         )
-        for t, c in sorted(tool_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+        for t, c in nlargest(10, tool_counts.items(), key=itemgetter(1))
     ]
 
     # Determine personality
@@ -186,7 +207,7 @@ def compute_fingerprint(sessions: list[Session]) -> Fingerprint | None:
         categories=categories,
         top_tools=top_tools,
         total_tool_uses=total,
-        raw_counts=tool_counts,
+        raw_counts=dict(tool_counts),
     )
 
 
@@ -201,12 +222,17 @@ def get_fingerprint_ascii(fingerprint: Fingerprint, width: int = 40) -> str:
 
     lines = [f"Your Coding DNA: {fingerprint.personality}", ""]
 
-    max_count = max(t.count for t in fingerprint.top_tools[:6])
+    shown = fingerprint.top_tools[:6]
+    max_count = max(t.count for t in shown)
     bar_width = width - 15  # Leave room for label and percentage
 
-    for tool in fingerprint.top_tools[:6]:
+    # Each bar is a slice of a full and an empty bar built once
+    full_bar = "█" * bar_width
+    empty_bar = "░" * bar_width
+
+    for tool in shown:
         bar_len = int((tool.count / max_count) * bar_width) if max_count > 0 else 0
-        bar = "█" * bar_len + "░" * (bar_width - bar_len)
+        bar = full_bar[:bar_len] + empty_bar[bar_len:]
         label = tool.name[:10].ljust(10)
         lines.append(f"  {label} {bar} {tool.percentage:4.1f}%")
 
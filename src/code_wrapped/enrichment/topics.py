@@ -7,8 +7,9 @@ Phase 2 upgrade: Embeddings + KMeans for semantic clustering.
 from __future__ import annotations
 
 import re
-from collections import defaultdict
+from collections import Counter
 from dataclasses import dataclass
+from itertools import islice
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -206,6 +207,18 @@ TOPIC_DISPLAY_NAMES: dict[str, str] = {
 }
 
 
+# Keywords made only of word characters match exactly when they equal a whole
+# word of the text, so they are looked up in the text's word set; the few
+# multi-word phrases keep a precompiled word-boundary regex
+_WORD_RE = re.compile(r"\w+")
+_PHRASE_RES: dict[str, re.Pattern[str]] = {
+    keyword: re.compile(rf"\b{re.escape(keyword)}\b")
+    for keywords in TOPIC_KEYWORDS.values()
+    for keyword in keywords
+    if not _WORD_RE.fullmatch(keyword)
+}
+
+
 @dataclass
 class TopicMatch:
     """A detected topic with confidence score."""
@@ -228,15 +241,27 @@ def detect_topic(text: str) -> TopicMatch | None:
     if not text:
         return None
 
-    text_lower = text.lower()
+    return _detect_topic_lower(text.lower())
+
+
+def _detect_topic_lower(text_lower: str) -> TopicMatch | None:
+    """Detect the primary topic from already-lowercased text."""
+    if not text_lower:
+        return None
+
+    words = set(_WORD_RE.findall(text_lower))
     topic_scores: dict[str, tuple[float, list[str]]] = {}
 
     for topic, keywords in TOPIC_KEYWORDS.items():
         matched = []
         for keyword in keywords:
-            # Use word boundary matching to avoid partial matches
-            pattern = rf"\b{re.escape(keyword)}\b"
-            if re.search(pattern, text_lower):
+            # Whole-word matching to avoid partial matches
+            phrase_re = _PHRASE_RES.get(keyword)
+            if phrase_re is None:
+                found = keyword in words
+            else:
+                found = phrase_re.search(text_lower) is not None
+            if found:
                 matched.append(keyword)
 
         if matched:
@@ -271,12 +296,9 @@ def detect_session_topic(session: Session) -> TopicMatch | None:
         TopicMatch or None
     """
     # Combine prompts and repo name for analysis
-    text_parts = session.user_prompts.copy()
     if session.repo:
-        text_parts.append(session.repo)
-
-    combined_text = " ".join(text_parts)
-    return detect_topic(combined_text)
+        return _detect_topic_lower(f"{session.prompt_text} {session.repo.lower()}")
+    return _detect_topic_lower(session.prompt_text)
 
 
 def compute_topic_distribution(sessions: list[Session]) -> dict[str, int]:
@@ -285,7 +307,7 @@ def compute_topic_distribution(sessions: list[Session]) -> dict[str, int]:
     Returns:
         Dict mapping topic display names to session counts
     """
-    topic_counts: dict[str, int] = defaultdict(int)
+    topic_counts: Counter[str] = Counter()
 
     for session in sessions:
         topic = detect_session_topic(session)
@@ -294,7 +316,7 @@ def compute_topic_distribution(sessions: list[Session]) -> dict[str, int]:
         else:
             topic_counts["Other"] += 1
 
-    return dict(sorted(topic_counts.items(), key=lambda x: x[1], reverse=True))
+    return dict(topic_counts.most_common())
 
 
 def get_top_topics(sessions: list[Session], limit: int = 5) -> list[tuple[str, int, float]]:
@@ -310,7 +332,7 @@ def get_top_topics(sessions: list[Session], limit: int = 5) -> list[tuple[str, i
         return []
 
     results = []
-    for topic, count in list(distribution.items())[:limit]:
+    for topic, count in islice(distribution.items(), limit):
         percentage = (count / total) * 100
         results.append((topic, count, percentage))
 
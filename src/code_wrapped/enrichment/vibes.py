@@ -8,8 +8,9 @@ Phase 2: Sentiment classifier or LLM analysis.
 from __future__ import annotations
 
 import re
-from collections import defaultdict
+from collections import Counter
 from dataclasses import dataclass
+from operator import itemgetter
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -117,6 +118,17 @@ VIBE_DISPLAY: dict[str, tuple[str, str]] = {
 }
 
 
+# Single-word patterns made only of word characters are counted from the
+# text's words; the rest (e.g. "can't") keep a precompiled word-boundary regex
+_WORD_RE = re.compile(r"\w+")
+_WORD_PATTERN_RES: dict[str, re.Pattern[str]] = {
+    pattern: re.compile(rf"\b{re.escape(pattern)}\b")
+    for patterns in VIBE_PATTERNS.values()
+    for pattern in patterns
+    if " " not in pattern and not _WORD_RE.fullmatch(pattern)
+}
+
+
 @dataclass
 class VibeMatch:
     """A detected vibe with confidence score."""
@@ -140,7 +152,15 @@ def detect_vibe(text: str) -> VibeMatch | None:
     if not text:
         return None
 
-    text_lower = text.lower()
+    return _detect_vibe_lower(text.lower())
+
+
+def _detect_vibe_lower(text_lower: str) -> VibeMatch | None:
+    """Detect the primary vibe from already-lowercased text."""
+    if not text_lower:
+        return None
+
+    word_counts = Counter(_WORD_RE.findall(text_lower))
     vibe_scores: dict[str, float] = {}
 
     for vibe, patterns in VIBE_PATTERNS.items():
@@ -154,8 +174,11 @@ def detect_vibe(text: str) -> VibeMatch | None:
                     total_score += weight
             else:
                 # Single words: word boundary match
-                regex = rf"\b{re.escape(pattern)}\b"
-                matches = len(re.findall(regex, text_lower))
+                regex = _WORD_PATTERN_RES.get(pattern)
+                if regex is None:
+                    matches = word_counts[pattern]
+                else:
+                    matches = len(regex.findall(text_lower))
                 total_score += weight * min(matches, 3)  # Cap at 3 matches per keyword
 
         if total_score > 0:
@@ -165,7 +188,7 @@ def detect_vibe(text: str) -> VibeMatch | None:
         return None
 
     # Get vibe with highest score
-    best_vibe = max(vibe_scores.items(), key=lambda x: x[1])
+    best_vibe = max(vibe_scores.items(), key=itemgetter(1))
     vibe_id, score = best_vibe
 
     # Normalize confidence (cap at 10 for full confidence)
@@ -193,8 +216,7 @@ def detect_session_vibe(session: Session) -> VibeMatch | None:
     Returns:
         VibeMatch or None
     """
-    combined_text = " ".join(session.user_prompts)
-    vibe = detect_vibe(combined_text)
+    vibe = _detect_vibe_lower(session.prompt_text)
 
     # Adjust vibe based on session characteristics
     if vibe:
@@ -229,7 +251,7 @@ def compute_vibe_distribution(sessions: list[Session]) -> dict[str, int]:
     Returns:
         Dict mapping vibe display names to session counts
     """
-    vibe_counts: dict[str, int] = defaultdict(int)
+    vibe_counts: Counter[str] = Counter()
 
     for session in sessions:
         vibe = detect_session_vibe(session)
@@ -238,7 +260,7 @@ def compute_vibe_distribution(sessions: list[Session]) -> dict[str, int]:
         else:
             vibe_counts["Neutral"] += 1
 
-    return dict(sorted(vibe_counts.items(), key=lambda x: x[1], reverse=True))
+    return dict(vibe_counts.most_common())
 
 
 def get_dominant_vibe(sessions: list[Session]) -> tuple[str, str, float] | None:
@@ -258,7 +280,7 @@ def get_dominant_vibe(sessions: list[Session]) -> tuple[str, str, float] | None:
     if not filtered:
         filtered = distribution
 
-    dominant_name = max(filtered.items(), key=lambda x: x[1])[0]
+    dominant_name = max(filtered.items(), key=itemgetter(1))[0]
     count = filtered[dominant_name]
     percentage = (count / total) * 100
 
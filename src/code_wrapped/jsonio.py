@@ -0,0 +1,83 @@
+"""JSON encoding/decoding helpers.
+
+Uses orjson when it is installed (``pip install code-wrapped[fast]``) and
+falls back to the standard library otherwise. orjson raises a subclass of
+``json.JSONDecodeError``, so callers can keep catching the stdlib exception.
+
+``iter_array`` streams large top-level arrays with ijson when it is installed
+(``pip install code-wrapped[stream]``).
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from json import JSONDecodeError
+from typing import IO, Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def loads_lines(lines: list[bytes]) -> list[Any]:
+    """Decode a batch of JSON Lines records, skipping blank and malformed lines.
+
+    The lines are spliced into a single JSON array so the common case is one
+    decoder call for the whole batch. If that fails (a blank or broken line),
+    or yields a different number of records than lines (one line holding
+    several comma-separated values), each line is decoded on its own.
+    """
+    try:
+        records = loads(b"[" + b",".join(lines) + b"]")
+    except JSONDecodeError:
+        pass
+    else:
+        if len(records) == len(lines):
+            return records
+
+    records = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            records.append(loads(line))
+        except JSONDecodeError:
+            continue
+    return records
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode obj as UTF-8 JSON bytes, optionally indented by two spaces."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def iter_array(fp: IO[bytes]) -> Iterator[Any]:
+    """Yield the elements of a top-level JSON array read from a binary file.
+
+    With ijson each element is built as it is read, so the whole array is
+    never held in memory; otherwise the document is decoded in one go.
+    A non-array document yields nothing.
+    """
+    if ijson is not None:
+        return ijson.items(fp, "item", use_float=True)
+    data = loads(fp.read())
+    return iter(data) if isinstance(data, list) else iter(())
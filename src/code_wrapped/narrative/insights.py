@@ -7,6 +7,7 @@ from coding statistics. Gracefully handles missing API keys.
 from __future__ import annotations
 
 import os
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -47,16 +48,21 @@ def _check_api_key() -> str | None:
     return os.getenv("ANTHROPIC_API_KEY")
 
 
-def generate_insights(context: NarrativeContext) -> Insights | None:
+def generate_insights(
+    context: NarrativeContext,
+    *,
+    api_key_fn: Callable[[], str | None] = _check_api_key,
+) -> Insights | None:
     """Generate LLM-powered narrative insights.
 
     Args:
         context: NarrativeContext with all stats
+        api_key_fn: Returns the Anthropic API key, or None (default: read the environment)
 
     Returns:
         Insights object with generated narratives, or None if API unavailable
     """
-    api_key = _check_api_key()
+    api_key = api_key_fn()
     if not api_key:
         return None
 
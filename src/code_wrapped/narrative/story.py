@@ -5,17 +5,31 @@ Prepares structured context from stats for LLM narrative generation.
 
 from __future__ import annotations
 
+import calendar
+from collections import Counter
 from dataclasses import dataclass
+from datetime import date, datetime
+from operator import attrgetter, itemgetter
 from typing import TYPE_CHECKING
 
+import numpy as np
+
+from ..stats import WEEKEND_MASK, counts_by_first_seen
+
 if TYPE_CHECKING:
     from ..stats import WrappedStats
     from ..enrichment.awards import Award
 
+# date.toordinal() of 1970-01-01, to turn date ordinals into datetime64 days
+_UNIX_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class NarrativeContext:
-    """Structured context for LLM narrative generation."""
+    """Structured context for LLM narrative generation.
+
+    Immutable once compiled; build a new context rather than patching fields.
+    """
 
     # Core stats
     year: int
@@ -188,33 +202,41 @@ def compile_narrative_context(
     is_night_owl = hour >= 22 or hour <= 4
     is_early_bird = 5 <= hour <= 8
 
-    # Weekend percentage
-    from datetime import datetime
-
-    weekend_count = 0
-    total_count = 0
-    for date_str, count in stats.daily_sessions.items():
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-            total_count += count
-            if date.weekday() >= 5:
-                weekend_count += count
-        except ValueError:
-            continue
-
+    # Weekend percentage and busiest month
+    if stats.sessions:
+        # Reduce over the session column arrays rather than the Session objects
+        columns = stats.columns
+        months = (
+            (columns.date_ordinal - _UNIX_EPOCH_ORDINAL)
+            .astype("datetime64[D]")
+            .astype("datetime64[M]")
+            .astype(np.int64)
+            % 12
+            + 1
+        )
+        weekday_counts = counts_by_first_seen(columns.day_of_week)
+        month_counts = counts_by_first_seen(months)
+    else:
+        # Stats reloaded from JSON only carry date strings
+        weekday_counts = Counter()
+        month_counts = Counter()
+        for date_str, count in stats.daily_sessions.items():
+            try:
+                date = datetime.strptime(date_str, "%Y-%m-%d")
+            except ValueError:
+                continue
+            weekday_counts[date.weekday()] += count
+            month_counts[date.month] += count
+
+    total_count = sum(weekday_counts.values())
+    weekend_count = sum(
+        count for weekday, count in weekday_counts.items() if (WEEKEND_MASK >> weekday) & 1
+    )
     weekend_pct = (weekend_count / total_count * 100) if total_count > 0 else 0.0
 
-    # Find busiest month
-    month_counts: dict[str, int] = {}
-    for date_str, count in stats.daily_sessions.items():
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-            month_key = date.strftime("%B")
-            month_counts[month_key] = month_counts.get(month_key, 0) + count
-        except ValueError:
-            continue
-
-    busiest_month = max(month_counts.items(), key=lambda x: x[1])[0] if month_counts else None
+    busiest_month = (
+        calendar.month_name[month_counts.most_common(1)[0][0]] if month_counts else None
+    )
 
     # Tool fingerprint
     fingerprint = compute_fingerprint(stats.sessions) if stats.sessions else None
@@ -225,22 +247,23 @@ def compile_narrative_context(
     )
 
     # Longest session details
-    longest_session_hours = 0.0
+    # max() keeps the first agent on ties, so agent order breaks them
+    longest_agent = max(
+        stats.agent_stats.values(), key=attrgetter("longest_session_minutes"), default=None
+    )
+    longest_session_minutes = longest_agent.longest_session_minutes if longest_agent else 0.0
+    longest_session_hours = longest_session_minutes / 60
     longest_session_topic = None
-    for agent_stats in stats.agent_stats.values():
-        if agent_stats.longest_session_minutes > longest_session_hours * 60:
-            longest_session_hours = agent_stats.longest_session_minutes / 60
-            # Try to find the session for topic
-            if stats.sessions and agent_stats.longest_session_id:
-                for session in stats.sessions:
-                    if session.id == agent_stats.longest_session_id:
-                        # Get first user prompt as topic hint
-                        if session.user_prompts:
-                            longest_session_topic = session.user_prompts[0][:50]
-                        break
+    if stats.sessions and longest_session_minutes > 0 and longest_agent.longest_session_id:
+        longest = next(
+            (s for s in stats.sessions if s.id == longest_agent.longest_session_id), None
+        )
+        # Get first user prompt as topic hint
+        if longest is not None and longest.user_prompts:
+            longest_session_topic = longest.user_prompts[0][:50]
 
     # Top repo
-    top_repo = max(stats.all_repos.items(), key=lambda x: x[1])[0] if stats.all_repos else None
+    top_repo = max(stats.all_repos.items(), key=itemgetter(1))[0] if stats.all_repos else None
 
     return NarrativeContext(
         year=stats.year,
@@ -2,21 +2,34 @@
 
 from __future__ import annotations
 
-import json
+from collections import Counter
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 
-from ..stats import WrappedStats
+from .. import jsonio
+from ..parsers.base import AgentType
+from ..stats import AgentStats, WrappedStats, sort_by_key, top_counts
 from ..viz.charts import generate_all_charts
 from ..viz.cards import generate_all_cards
 
+# Enrichment sections that are safe to include in the shareable JSON
+SHARE_ENRICHMENT_KEYS = frozenset({'vibe', 'archetype', 'fingerprint', 'awards', 'topics'})
 
+# Agent names this version can load from a saved wrapped JSON
+KNOWN_AGENT_NAMES = frozenset(agent.value for agent in AgentType)
+
+
+@lru_cache(maxsize=1)
 def get_template_env() -> Environment:
     """Get Jinja2 environment for templates.
 
+    The environment is shared, so its template cache compiles each
+    template only once per process.
+
     Returns:
         Jinja2 Environment configured for templates
     """
@@ -40,13 +53,15 @@ def charts_to_json(charts: dict[str, Any]) -> str:
     chart_data = {}
 
     for name, fig in charts.items():
-        # Convert Plotly figure to JSON-serializable dict
+        # Convert Plotly figure to JSON-serializable dict (to_dict deep-copies
+        # the whole figure, so call it once)
+        fig_dict = fig.to_dict()
         chart_data[name] = {
-            'data': fig.to_dict()['data'],
-            'layout': fig.to_dict()['layout'],
+            'data': fig_dict['data'],
+            'layout': fig_dict['layout'],
         }
 
-    return json.dumps(chart_data)
+    return jsonio.dumps(chart_data).decode('utf-8')
 
 
 def generate_html_report(
@@ -86,10 +101,10 @@ def generate_html_report(
         },
         'agents': {},
         'distributions': {
-            'by_hour': dict(sorted(stats.hours_distribution.items())),
-            'by_day': dict(sorted(stats.daily_sessions.items())),
-            'by_repo': dict(sorted(stats.all_repos.items(), key=lambda x: x[1], reverse=True)[:10]),
-            'by_tool': dict(sorted(stats.all_tools.items(), key=lambda x: x[1], reverse=True)[:15]),
+            'by_hour': sort_by_key(stats.hours_distribution),
+            'by_day': sort_by_key(stats.daily_sessions),
+            'by_repo': top_counts(stats.all_repos, 10),
+            'by_tool': top_counts(stats.all_tools, 15),
         },
         'enrichment': enrichment,
         'narrative': narrative,
@@ -105,8 +120,8 @@ def generate_html_report(
                 'tokens': agent_stats.token_count,
                 'avg_turns_per_session': agent_stats.avg_turns_per_session,
                 'avg_duration_minutes': agent_stats.avg_duration_minutes,
-                'top_repos': dict(sorted(agent_stats.repos.items(), key=lambda x: x[1], reverse=True)[:5]),
-                'top_tools': dict(sorted(agent_stats.tools_used.items(), key=lambda x: x[1], reverse=True)[:10]),
+                'top_repos': top_counts(agent_stats.repos, 5),
+                'top_tools': top_counts(agent_stats.tools_used, 10),
             }
 
     # Render template
@@ -142,7 +157,7 @@ def generate_full_report(
     outputs = {}
 
     # Get enrichment data
-    enrichment = stats._compute_enrichment() if stats.sessions else {}
+    enrichment = stats.enrichment
 
     # Generate HTML report
     html_path = output_dir / f"wrapped-{stats.year}.html"
@@ -172,15 +187,11 @@ def generate_full_report(
             for agent, agent_stats in stats.agent_stats.items()
             if agent_stats.session_count > 0
         },
-        'enrichment': {
-            k: v for k, v in enrichment.items()
-            if k in ['vibe', 'archetype', 'fingerprint', 'awards', 'topics']
-        }
+        'enrichment': {k: v for k, v in enrichment.items() if k in SHARE_ENRICHMENT_KEYS},
     }
 
     share_path = output_dir / f"wrapped-{stats.year}-share.json"
-    with open(share_path, 'w') as f:
-        json.dump(share_data, f, indent=2)
+    share_path.write_bytes(jsonio.dumps(share_data, indent=True))
     outputs['share_json'] = share_path
 
     return outputs
@@ -195,15 +206,12 @@ def load_wrapped_json(json_path: Path) -> tuple[WrappedStats, dict[str, Any]]:
     Returns:
         Tuple of (WrappedStats, enrichment_dict)
     """
-    with open(json_path) as f:
-        data = json.load(f)
+    data = jsonio.loads(json_path.read_bytes())
 
     # We need to reconstruct the WrappedStats object from JSON
     # This is a simplified loader - in practice you might want to
     # re-run the full analysis. For now, we'll just use the JSON data directly.
 
-    from ..parsers.base import AgentType
-
     stats = WrappedStats(
         year=data['year'],
         generated_at=datetime.fromisoformat(data['generated_at']),
@@ -214,29 +222,34 @@ def load_wrapped_json(json_path: Path) -> tuple[WrappedStats, dict[str, Any]]:
         active_days=data['summary']['active_days'],
         longest_streak_days=data['summary']['longest_streak_days'],
         current_streak_days=data['summary'].get('current_streak_days', 0),
-        all_repos=data['distributions'].get('by_repo', {}),
-        all_tools=data['distributions'].get('by_tool', {}),
-        hours_distribution={int(k): v for k, v in data['distributions'].get('by_hour', {}).items()},
-        daily_sessions=data['distributions'].get('by_day', {}),
+        all_repos=Counter(data['distributions'].get('by_repo', {})),
+        all_tools=Counter(data['distributions'].get('by_tool', {})),
+        hours_distribution=Counter(
+            {int(k): v for k, v in data['distributions'].get('by_hour', {}).items()}
+        ),
+        daily_sessions=Counter(data['distributions'].get('by_day', {})),
     )
 
-    # Populate agent stats
-    for agent_name, agent_data in data.get('agents', {}).items():
-        try:
-            agent_type = AgentType(agent_name)
-            from ..stats import AgentStats
-            agent_stats = AgentStats(
-                agent=agent_type,
-                session_count=agent_data['sessions'],
-                turn_count=agent_data['turns'],
-                token_count=agent_data.get('tokens', 0),
-                total_duration_minutes=agent_data.get('avg_duration_minutes', 0) * agent_data['sessions'],
-                repos=agent_data.get('top_repos', {}),
-                tools_used=agent_data.get('top_tools', {}),
-            )
-            stats.agent_stats[agent_type] = agent_stats
-        except ValueError:
-            continue
+    # Populate agent stats, skipping agents this version doesn't know about
+    known_agents = (
+        (AgentType(agent_name), agent_data)
+        for agent_name, agent_data in data.get('agents', {}).items()
+        if agent_name in KNOWN_AGENT_NAMES
+    )
+    stats.agent_stats = {
+        agent: AgentStats(
+            agent=agent,
+            session_count=agent_data['sessions'],
+            turn_count=agent_data['turns'],
+            token_count=agent_data.get('tokens', 0),
+            total_duration_minutes=(
+                agent_data.get('avg_duration_minutes', 0) * agent_data['sessions']
+            ),
+            repos=Counter(agent_data.get('top_repos', {})),
+            tools_used=Counter(agent_data.get('top_tools', {})),
+        )
+        for agent, agent_data in known_agents
+    }
 
     # Get enrichment
     enrichment = data.get('enrichment', {})
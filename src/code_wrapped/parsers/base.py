@@ -2,13 +2,32 @@
 
 from __future__ import annotations
 
+import mmap
+import os
 import re
+import sys
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
 from typing import Literal, Optional
 
+# Directories that typically hold checkouts, in priority order
+GIT_DIR_NAMES = ("git", "projects", "repos", "src", "code")
+_GIT_DIR_SET = frozenset(GIT_DIR_NAMES)
+
+# Upper bound on threads used to parse session files concurrently
+MAX_PARSE_WORKERS = 32
+
+# Files at least this large are read through mmap rather than buffered reads
+MMAP_MIN_BYTES = 256 * 1024
+
 
 class AgentType(str, Enum):
     """Supported AI coding agents."""
@@ -19,7 +38,7 @@ class AgentType(str, Enum):
     GEMINI = "gemini"
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """Unified session model across all agents.
 
@@ -51,6 +70,8 @@ class Session:
 
     # Content (for analysis - redacted/sanitized)
     user_prompts: list[str] = field(default_factory=list)
+    # Lowercased prompts joined by spaces, computed once for the keyword matchers
+    prompt_text: str = field(default="", init=False, repr=False, compare=False)
 
     # Enriched (computed later)
     topic: Optional[str] = None
@@ -68,6 +89,7 @@ class Session:
         if self.ended_at and self.started_at:
             delta = self.ended_at - self.started_at
             self.duration_minutes = delta.total_seconds() / 60
+        self.prompt_text = " ".join(self.user_prompts).lower()
 
     @property
     def hour_of_day(self) -> int:
@@ -79,6 +101,11 @@ class Session:
         """Return day of week (0=Monday, 6=Sunday)."""
         return self.started_at.weekday()
 
+    @property
+    def date_ordinal(self) -> int:
+        """Return the start date as a proleptic Gregorian ordinal."""
+        return self.started_at.toordinal()
+
     @property
     def date_str(self) -> str:
         """Return date as YYYY-MM-DD string."""
@@ -100,24 +127,150 @@ def extract_repo_from_path(cwd: str | None) -> str | None:
     if not cwd:
         return None
 
-    path = Path(cwd)
-
     # Home directory
-    if path == Path.home():
+    if cwd.rstrip("/") == str(Path.home()):
         return "~"
 
-    # Check common git directory patterns
-    parts = path.parts
-    for git_dir in ("git", "projects", "repos", "src", "code"):
-        if git_dir in parts:
-            idx = parts.index(git_dir)
-            # Return all parts after the git directory as the repo path
-            if idx + 1 < len(parts):
-                remaining = parts[idx + 1 :]
-                return "/".join(remaining)
+    parts = [part for part in cwd.split("/") if part]
+
+    # Single pass: remember where each git directory name first appears
+    first_seen: dict[str, int] = {}
+    for idx, part in enumerate(parts):
+        if part in _GIT_DIR_SET and part not in first_seen:
+            first_seen[part] = idx
+
+    # Check common git directory patterns in priority order
+    for git_dir in GIT_DIR_NAMES:
+        idx = first_seen.get(git_dir)
+        # Return all parts after the git directory as the repo path
+        if idx is not None and idx + 1 < len(parts):
+            return "/".join(parts[idx + 1 :])
 
     # Fallback: use last directory name
-    return path.name if path.name else None
+    return parts[-1] if parts else None
+
+
+def _scan_dir(directory: str, components: tuple[str, ...]) -> list[str]:
+    """Match a relative glob layout under directory, one os.scandir per level."""
+    name_pattern, rest = components[0], components[1:]
+    found: list[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not fnmatchcase(entry.name, name_pattern):
+                    continue
+                if rest:
+                    if entry.is_dir():
+                        found.extend(_scan_dir(entry.path, rest))
+                elif entry.is_file():
+                    found.append(entry.path)
+    except OSError:
+        pass
+    return found
+
+
+def _scan_layout(root: str, pattern: str) -> list[str]:
+    """Find files matching a '/'-separated glob layout under root.
+
+    Top-level subdirectories are scanned concurrently, since directory
+    reads on wide trees (and network filesystems) are latency-bound.
+    """
+    components = tuple(pattern.split("/"))
+    if len(components) == 1:
+        return _scan_dir(root, components)
+
+    try:
+        with os.scandir(root) as entries:
+            subdirs = [
+                entry.path
+                for entry in entries
+                if fnmatchcase(entry.name, components[0]) and entry.is_dir()
+            ]
+    except OSError:
+        return []
+
+    if not subdirs:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(MAX_PARSE_WORKERS, len(subdirs))) as pool:
+        batches = pool.map(_scan_dir, subdirs, repeat(components[1:]))
+        return [path for batch in batches for path in batch]
+
+
+def _modified_since(path: Path, cutoff: float) -> bool:
+    try:
+        return os.stat(path).st_mtime >= cutoff
+    except OSError:
+        return False
+
+
+def find_session_files(
+    root: Path,
+    patterns: tuple[str, ...],
+    fallback_pattern: str,
+    modified_after: datetime | None = None,
+) -> list[Path]:
+    """Find session files using the agent's known directory layout.
+
+    Scans only the given layout patterns (relative to root), which avoids
+    walking unrelated subtrees. If nothing matches, the layout is unknown,
+    so fall back to a recursive search for fallback_pattern.
+
+    If modified_after is given, files last written before it are dropped
+    without being opened: a session file is appended to as the session
+    runs, so everything in it predates its mtime.
+    """
+    files = [Path(path) for pattern in patterns for path in _scan_layout(str(root), pattern)]
+    if not files:
+        files = list(root.rglob(fallback_pattern))
+
+    if modified_after is not None:
+        cutoff = modified_after.timestamp()
+        files = [path for path in files if _modified_since(path, cutoff)]
+
+    return files
+
+
+def iter_file_lines(path: Path) -> Iterator[bytes]:
+    """Yield the raw lines of a file as bytes, including line endings.
+
+    Large files are memory-mapped and read line by line straight from the
+    page cache; smaller ones use an ordinary buffered binary read.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+            yield from f
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from iter(mm.readline, b"")
+
+
+# Secret patterns, compiled once into a single alternation
+_SECRET_RE = re.compile(
+    "|".join(
+        [
+            r"sk-[a-zA-Z0-9]{20,}",  # OpenAI keys
+            r"sk-ant-[a-zA-Z0-9-]{20,}",  # Anthropic keys
+            r"ghp_[a-zA-Z0-9]{36}",  # GitHub tokens
+            r"password[=:]\s*\S+",  # Passwords
+            r"api[_-]?key[=:]\s*\S+",  # API keys
+        ]
+    ),
+    re.IGNORECASE,
+)
+
+# Absolute macOS/Linux home paths; group 1 is the final path component
+_HOME_PATH_RE = re.compile(r"/(?:Users|home)/[^/]+/[^\s]+/([^/\s]+)")
+
+
+def count_tools(tool_names: Iterable[str]) -> dict[str, int]:
+    """Count tool uses by name.
+
+    Names are interned: the same few tool names key the ``tools_used`` of
+    every session, so they share one string object each instead of one
+    copy per parsed message.
+    """
+    return {sys.intern(name): count for name, count in Counter(tool_names).items()}
 
 
 def sanitize_prompt(prompt: str, max_length: int = 200) -> str:
@@ -135,32 +288,36 @@ def sanitize_prompt(prompt: str, max_length: int = 200) -> str:
         prompt = prompt[:max_length] + "..."
 
     # Remove common secret patterns
-    secret_patterns = [
-        r"sk-[a-zA-Z0-9]{20,}",  # OpenAI keys
-        r"sk-ant-[a-zA-Z0-9-]{20,}",  # Anthropic keys
-        r"ghp_[a-zA-Z0-9]{36}",  # GitHub tokens
-        r"password[=:]\s*\S+",  # Passwords
-        r"api[_-]?key[=:]\s*\S+",  # API keys
-    ]
-
-    for pattern in secret_patterns:
-        prompt = re.sub(pattern, "[REDACTED]", prompt, flags=re.IGNORECASE)
+    prompt = _SECRET_RE.sub("[REDACTED]", prompt)
 
     # Remove full paths, keep just filenames
-    prompt = re.sub(r"/Users/[^/]+/[^\s]+/([^/\s]+)", r"\1", prompt)
-    prompt = re.sub(r"/home/[^/]+/[^\s]+/([^/\s]+)", r"\1", prompt)
+    prompt = _HOME_PATH_RE.sub(r"\1", prompt)
 
     return prompt
 
 
-def parse_iso_timestamp(ts: str | None) -> datetime | None:
-    """Parse ISO8601 timestamp string to datetime."""
+def parse_iso_timestamp(ts: str | None, cache: bool = True) -> datetime | None:
+    """Parse ISO8601 timestamp string to datetime.
+
+    Parsed values are cached, since parsers see the same timestamp strings
+    many times (first/last message lookups, shared log batches). Pass
+    cache=False for per-message parsing of mostly distinct timestamps,
+    where the cache bookkeeping costs more than the parse itself.
+    """
     if not ts:
         return None
 
+    if cache:
+        return _parse_iso_timestamp_cached(ts)
+    return _parse_iso_timestamp(ts)
+
+
+def _parse_iso_timestamp(ts: str) -> datetime | None:
     try:
-        # Handle Z suffix
-        ts = ts.replace("Z", "+00:00")
+        # fromisoformat accepts the Z suffix natively on Python 3.11+
         return datetime.fromisoformat(ts)
     except (ValueError, TypeError):
         return None
+
+
+_parse_iso_timestamp_cached = lru_cache(maxsize=4096)(_parse_iso_timestamp)
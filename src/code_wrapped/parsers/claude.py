@@ -2,69 +2,102 @@
 
 from __future__ import annotations
 
-import json
-from collections import defaultdict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any
 
+from .. import jsonio
 from .base import (
+    MAX_PARSE_WORKERS,
     AgentType,
     Session,
+    count_tools,
     extract_repo_from_path,
+    find_session_files,
+    iter_file_lines,
     parse_iso_timestamp,
     sanitize_prompt,
 )
 
+# Session-level fields and how many leading lines to search for them
+METADATA_FIELDS = ("cwd", "sessionId", "timestamp", "gitBranch")
+METADATA_MAX_LINES = 10
+
+# Lines decoded per jsonio.loads_lines call
+DECODE_BATCH_LINES = 1024
+
 
 def get_claude_sessions_dir() -> Path:
     """Return the default Claude sessions directory."""
     return Path.home() / ".claude" / "projects"
 
 
-def find_field_in_session(lines: list[str], field: str, max_lines: int = 10) -> Any | None:
-    """Walk session lines until we find a non-null value for the given field."""
-    for line in lines[:max_lines]:
-        try:
-            obj = json.loads(line)
-            value = obj.get(field)
-            if value and value != "null":
-                return value
-        except json.JSONDecodeError:
-            continue
-    return None
+@dataclass
+class MessageSummary:
+    """Per-session values collected from Claude messages."""
 
+    user_count: int = 0
+    assistant_count: int = 0
+    token_count: int | None = None
+    tools: dict[str, int] = field(default_factory=dict)
+    prompts: list[str] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    last_timestamp: str | None = None
 
-def extract_tool_uses(messages: list[dict]) -> dict[str, int]:
-    """Extract tool usage counts from messages."""
-    tools: dict[str, int] = defaultdict(int)
 
-    for msg in messages:
-        content = msg.get("message", {}).get("content", [])
-        if isinstance(content, list):
-            for item in content:
-                if isinstance(item, dict) and item.get("type") == "tool_use":
-                    tool_name = item.get("name", "unknown")
-                    tools[tool_name] += 1
-
-    return dict(tools)
-
-
-def extract_errors(messages: list[dict]) -> list[str]:
-    """Extract error messages from tool results."""
+def summarize_messages(messages: list[dict]) -> MessageSummary:
+    """Collect counts, tool uses, prompts, errors and tokens in one pass."""
+    user_count = 0
+    assistant_count = 0
+    total_input = 0
+    total_output = 0
+    tool_names: list[str] = []
+    prompts: list[str] = []
     errors: list[str] = []
+    last_timestamp = None
 
     for msg in messages:
-        # Check for tool_result errors
-        if msg.get("type") == "user":
-            content = msg.get("message", {}).get("content", [])
-            if isinstance(content, list):
-                for item in content:
-                    if isinstance(item, dict) and item.get("type") == "tool_result":
-                        if item.get("is_error"):
-                            error_content = item.get("content", "")
-                            if error_content and len(error_content) < 500:
-                                errors.append(error_content[:200])
+        msg_type = msg.get("type")
+        is_user = msg_type == "user"
+        message = msg.get("message")
+        content = message.get("content") if message else None
+
+        ts = msg.get("timestamp")
+        if ts:
+            last_timestamp = ts
+
+        if is_user:
+            user_count += 1
+        elif msg_type == "assistant":
+            assistant_count += 1
+            # Sum up token usage
+            usage = message.get("usage") if message else None
+            if usage:
+                usage_get = usage.get
+                total_input += usage_get("input_tokens", 0)
+                total_input += usage_get("cache_creation_input_tokens", 0)
+                total_input += usage_get("cache_read_input_tokens", 0)
+                total_output += usage_get("output_tokens", 0)
+
+        if isinstance(content, list):
+            for item in content:
+                if isinstance(item, dict):
+                    item_type = item.get("type")
+                    if item_type == "tool_use":
+                        tool_names.append(item.get("name", "unknown"))
+                    elif is_user and item_type == "tool_result" and item.get("is_error"):
+                        error_content = item.get("content")
+                        if error_content and len(error_content) < 500:
+                            errors.append(error_content[:200])
+                elif is_user and isinstance(item, str):
+                    # Skip tool results, only get actual user text
+                    prompts.append(sanitize_prompt(item))
+        elif is_user and isinstance(content, str):
+            prompts.append(sanitize_prompt(content))
 
         # Check toolUseResult for errors (can be dict or string)
         tool_result = msg.get("toolUseResult")
@@ -73,70 +106,45 @@ def extract_errors(messages: list[dict]) -> list[str]:
             if len(stderr) < 500:
                 errors.append(stderr[:200])
 
-    return errors[:10]  # Limit to 10 errors per session
-
-
-def extract_user_prompts(messages: list[dict]) -> list[str]:
-    """Extract and sanitize user prompts from messages."""
-    prompts: list[str] = []
-
-    for msg in messages:
-        if msg.get("type") == "user":
-            content = msg.get("message", {}).get("content")
-            if isinstance(content, str):
-                prompts.append(sanitize_prompt(content))
-            elif isinstance(content, list):
-                # Skip tool results, only get actual user text
-                for item in content:
-                    if isinstance(item, dict) and item.get("type") == "tool_result":
-                        continue
-                    if isinstance(item, str):
-                        prompts.append(sanitize_prompt(item))
-
-    return prompts
-
-
-def extract_token_count(messages: list[dict]) -> int | None:
-    """Sum up token usage from assistant messages."""
-    total_input = 0
-    total_output = 0
-
-    for msg in messages:
-        if msg.get("type") == "assistant":
-            usage = msg.get("message", {}).get("usage", {})
-            total_input += usage.get("input_tokens", 0)
-            total_input += usage.get("cache_creation_input_tokens", 0)
-            total_input += usage.get("cache_read_input_tokens", 0)
-            total_output += usage.get("output_tokens", 0)
-
-    return total_input + total_output if (total_input or total_output) else None
+    return MessageSummary(
+        user_count=user_count,
+        assistant_count=assistant_count,
+        token_count=total_input + total_output if (total_input or total_output) else None,
+        tools=count_tools(tool_names),
+        prompts=prompts,
+        errors=errors[:10],  # Limit to 10 errors per session
+        last_timestamp=last_timestamp,
+    )
 
 
 def parse_session_file(session_file: Path) -> Session | None:
     """Parse a single Claude session file into a Session object."""
     try:
-        with open(session_file) as f:
-            lines = f.readlines()
-
-        if not lines:
-            return None
-
-        # Parse all messages
+        # Decode lines in batches as they are read from the file
         messages: list[dict] = []
-        for line in lines:
-            try:
-                messages.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
+        lines = iter_file_lines(session_file)
+        while batch := list(islice(lines, DECODE_BATCH_LINES)):
+            messages.extend(jsonio.loads_lines(batch))
 
         if not messages:
             return None
 
+        # Session metadata lives in the first few messages
+        metadata: dict[str, Any] = {}
+        for msg in islice(messages, METADATA_MAX_LINES):
+            for key in METADATA_FIELDS:
+                if key not in metadata:
+                    value = msg.get(key)
+                    if value and value != "null":
+                        metadata[key] = value
+            if len(metadata) == len(METADATA_FIELDS):
+                break
+
         # Extract session metadata
-        cwd = find_field_in_session(lines, "cwd")
-        session_id = find_field_in_session(lines, "sessionId")
-        timestamp_str = find_field_in_session(lines, "timestamp")
-        branch = find_field_in_session(lines, "gitBranch")
+        cwd = metadata.get("cwd")
+        session_id = metadata.get("sessionId")
+        timestamp_str = metadata.get("timestamp")
+        branch = metadata.get("gitBranch")
 
         if not timestamp_str:
             return None
@@ -145,32 +153,22 @@ def parse_session_file(session_file: Path) -> Session | None:
         if not started_at:
             return None
 
-        # Find end timestamp
-        ended_at = None
-        for msg in reversed(messages):
-            ts = msg.get("timestamp")
-            if ts:
-                ended_at = parse_iso_timestamp(ts)
-                break
-
-        # Count messages by type
-        user_count = sum(1 for m in messages if m.get("type") == "user")
-        assistant_count = sum(1 for m in messages if m.get("type") == "assistant")
+        summary = summarize_messages(messages)
 
         return Session(
             id=session_id or session_file.stem,
             agent=AgentType.CLAUDE,
             started_at=started_at,
-            ended_at=ended_at,
+            ended_at=parse_iso_timestamp(summary.last_timestamp),
             repo=extract_repo_from_path(cwd),
             branch=branch,
             turn_count=len(messages),
-            user_message_count=user_count,
-            assistant_message_count=assistant_count,
-            token_count=extract_token_count(messages),
-            tools_used=extract_tool_uses(messages),
-            user_prompts=extract_user_prompts(messages),
-            errors=extract_errors(messages),
+            user_message_count=summary.user_count,
+            assistant_message_count=summary.assistant_count,
+            token_count=summary.token_count,
+            tools_used=summary.tools,
+            user_prompts=summary.prompts,
+            errors=summary.errors,
         )
 
     except Exception as e:
@@ -207,19 +205,22 @@ def parse_claude_sessions(
     if year and not end_date:
         end_date = datetime(year, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
 
-    # Find all session files
-    session_files = list(sessions_dir.rglob("*.jsonl"))
+    # Find all session files (<projects>/<encoded-cwd>/<session>.jsonl)
+    session_files = find_session_files(
+        sessions_dir, ("*/*.jsonl",), "*.jsonl", modified_after=start_date
+    )
 
-    for session_file in session_files:
-        session = parse_session_file(session_file)
-
-        if session is None:
-            continue
+    # Files are independent; parse them on a thread pool (map keeps file order)
+    workers = min(MAX_PARSE_WORKERS, len(session_files)) or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for session in pool.map(parse_session_file, session_files):
+            if session is None:
+                continue
 
-        # Apply date filters
-        if start_date and session.started_at < start_date:
-            continue
-        if end_date and session.started_at > end_date:
-            continue
+            # Apply date filters
+            if start_date and session.started_at < start_date:
+                continue
+            if end_date and session.started_at > end_date:
+                continue
 
-        yield session
+            yield session
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
-import json
-from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterator
 
+from .. import jsonio
 from .base import (
+    MAX_PARSE_WORKERS,
     AgentType,
     Session,
+    count_tools,
     extract_repo_from_path,
+    find_session_files,
     parse_iso_timestamp,
     sanitize_prompt,
 )
@@ -22,38 +25,39 @@ def get_codex_sessions_dir() -> Path:
     return Path.home() / ".codex" / "sessions"
 
 
-def extract_tool_uses_codex(messages: list[dict]) -> dict[str, int]:
-    """Extract tool usage from Codex response items."""
-    tools: dict[str, int] = defaultdict(int)
+def summarize_items(items: Iterable[dict]) -> tuple[int, int, dict[str, int], list[str]]:
+    """Count roles, tool calls and user prompts across Codex items in one pass.
 
-    for msg in messages:
-        if msg.get("type") == "response_item":
-            payload = msg.get("payload", {})
-            # Codex uses different tool format
-            if payload.get("type") == "function_call":
-                tool_name = payload.get("name", "unknown")
-                tools[tool_name] += 1
+    Items are entries of the old-format ``items`` list or payloads of
+    new-format ``response_item`` messages; both share the same shape.
 
-    return dict(tools)
-
-
-def extract_user_prompts_codex(messages: list[dict]) -> list[str]:
-    """Extract user prompts from Codex messages."""
+    Returns:
+        (user_count, assistant_count, tools_used, user_prompts)
+    """
+    user_count = 0
+    assistant_count = 0
+    tool_names: list[str] = []
     prompts: list[str] = []
 
-    for msg in messages:
-        if msg.get("type") == "response_item":
-            payload = msg.get("payload", {})
-            if payload.get("role") == "user":
-                content = payload.get("content", [])
-                if isinstance(content, list):
-                    for item in content:
-                        if isinstance(item, dict) and item.get("type") == "input_text":
-                            text = item.get("text", "")
-                            if text:
-                                prompts.append(sanitize_prompt(text))
+    for item in items:
+        role = item.get("role")
+        if role == "user":
+            user_count += 1
+            content = item.get("content")
+            if isinstance(content, list):
+                for c in content:
+                    if isinstance(c, dict) and c.get("type") == "input_text":
+                        text = c.get("text")
+                        if text:
+                            prompts.append(sanitize_prompt(text))
+        elif role == "assistant":
+            assistant_count += 1
 
-    return prompts
+        # Codex uses different tool format
+        if item.get("type") == "function_call":
+            tool_names.append(item.get("name", "unknown"))
+
+    return user_count, assistant_count, count_tools(tool_names), prompts
 
 
 def parse_codex_session_file(session_file: Path) -> Session | None:
@@ -65,9 +69,8 @@ def parse_codex_session_file(session_file: Path) -> Session | None:
     """
     try:
         # Codex can be .json or .jsonl
-        if session_file.suffix == ".json":
-            with open(session_file) as f:
-                data = json.load(f)
+        if session_file.name.endswith(".json"):
+            data = jsonio.loads(session_file.read_bytes())
 
             # Handle old format: {"session": {...}, "items": [...]}
             if isinstance(data, dict) and "session" in data:
@@ -85,28 +88,7 @@ def parse_codex_session_file(session_file: Path) -> Session | None:
                 if not started_at:
                     return None
 
-                # Count user/assistant messages from items
-                user_count = sum(1 for item in items if item.get("role") == "user")
-                assistant_count = sum(1 for item in items if item.get("role") == "assistant")
-
-                # Extract tool uses from items
-                tools: dict[str, int] = defaultdict(int)
-                for item in items:
-                    if item.get("type") == "function_call":
-                        tool_name = item.get("name", "unknown")
-                        tools[tool_name] += 1
-
-                # Extract user prompts
-                prompts: list[str] = []
-                for item in items:
-                    if item.get("role") == "user":
-                        content = item.get("content", [])
-                        if isinstance(content, list):
-                            for c in content:
-                                if isinstance(c, dict) and c.get("type") == "input_text":
-                                    text = c.get("text", "")
-                                    if text:
-                                        prompts.append(sanitize_prompt(text))
+                user_count, assistant_count, tools, prompts = summarize_items(items)
 
                 return Session(
                     id=session_id or session_file.stem,
@@ -116,7 +98,7 @@ def parse_codex_session_file(session_file: Path) -> Session | None:
                     turn_count=len(items),
                     user_message_count=user_count,
                     assistant_message_count=assistant_count,
-                    tools_used=dict(tools),
+                    tools_used=tools,
                     user_prompts=prompts,
                 )
 
@@ -127,8 +109,7 @@ def parse_codex_session_file(session_file: Path) -> Session | None:
                 messages = [data]
         else:
             # JSONL format
-            with open(session_file) as f:
-                messages = [json.loads(line) for line in f if line.strip()]
+            messages = jsonio.loads_lines(session_file.read_bytes().splitlines())
 
         if not messages:
             return None
@@ -162,19 +143,12 @@ def parse_codex_session_file(session_file: Path) -> Session | None:
                 ended_at = parse_iso_timestamp(ts)
                 break
 
-        # Count messages
-        user_count = sum(
-            1
-            for m in messages
-            if m.get("type") == "response_item"
-            and m.get("payload", {}).get("role") == "user"
-        )
-        assistant_count = sum(
-            1
-            for m in messages
-            if m.get("type") == "response_item"
-            and m.get("payload", {}).get("role") == "assistant"
-        )
+        payloads = [
+            payload
+            for msg in messages
+            if msg.get("type") == "response_item" and (payload := msg.get("payload"))
+        ]
+        user_count, assistant_count, tools, prompts = summarize_items(payloads)
 
         return Session(
             id=session_id or session_file.stem,
@@ -185,8 +159,8 @@ def parse_codex_session_file(session_file: Path) -> Session | None:
             turn_count=len(messages),
             user_message_count=user_count,
             assistant_message_count=assistant_count,
-            tools_used=extract_tool_uses_codex(messages),
-            user_prompts=extract_user_prompts_codex(messages),
+            tools_used=tools,
+            user_prompts=prompts,
         )
 
     except Exception:
@@ -222,19 +196,27 @@ def parse_codex_sessions(
     if year and not end_date:
         end_date = datetime(year, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
 
-    # Find all session files (.json and .jsonl)
-    session_files = list(sessions_dir.rglob("*.json")) + list(sessions_dir.rglob("*.jsonl"))
-
-    for session_file in session_files:
-        session = parse_codex_session_file(session_file)
-
-        if session is None:
-            continue
-
-        # Apply date filters
-        if start_date and session.started_at < start_date:
-            continue
-        if end_date and session.started_at > end_date:
-            continue
-
-        yield session
+    # Find all session files: legacy *.json at the top level, newer
+    # <year>/<month>/<day>/*.jsonl rollouts
+    session_files = [
+        path
+        for path in find_session_files(
+            sessions_dir, ("*.json*", "*/*/*/*.json*"), "*.json*", modified_after=start_date
+        )
+        if path.name.endswith((".json", ".jsonl"))
+    ]
+
+    # Files are independent; parse them on a thread pool (map keeps file order)
+    workers = min(MAX_PARSE_WORKERS, len(session_files)) or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for session in pool.map(parse_codex_session_file, session_files):
+            if session is None:
+                continue
+
+            # Apply date filters
+            if start_date and session.started_at < start_date:
+                continue
+            if end_date and session.started_at > end_date:
+                continue
+
+            yield session
@@ -2,14 +2,33 @@
 
 from __future__ import annotations
 
-import json
 import sqlite3
+from collections.abc import Iterator
+from contextlib import closing
 from datetime import datetime, timezone
+from json import JSONDecodeError
 from pathlib import Path
-from typing import Iterator
 
+from .. import jsonio
 from .base import AgentType, Session
 
+# SQLite tuning for the (often several hundred MB) global state database
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+SQLITE_CACHE_SIZE = -64 * 1024  # Negative means KiB, i.e. 64 MiB
+
+# Bubble keys look like "bubbleId:<composerId>:<bubbleId>"; group by composer in SQL
+BUBBLE_COUNTS_QUERY = """
+    SELECT
+        CASE WHEN instr(substr(key, 10), ':') > 0
+            THEN substr(key, 10, instr(substr(key, 10), ':') - 1)
+            ELSE substr(key, 10)
+        END AS composer_id,
+        COUNT(*)
+    FROM cursorDiskKV
+    WHERE key LIKE 'bubbleId:%'
+    GROUP BY composer_id
+"""
+
 
 def get_cursor_db_path() -> Path:
     """Return the default Cursor database path."""
@@ -46,62 +65,61 @@ def parse_cursor_sessions(
         end_date = datetime(year, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
 
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
-
-        # First pass: count messages (bubbles) per composer
-        cursor.execute("SELECT key FROM cursorDiskKV WHERE key LIKE 'bubbleId:%'")
-        message_counts: dict[str, int] = {}
-        for (key,) in cursor.fetchall():
-            parts = key.split(":")
-            if len(parts) >= 2:
-                composer_id = parts[1]
-                message_counts[composer_id] = message_counts.get(composer_id, 0) + 1
-
-        # Second pass: get composer metadata
-        cursor.execute("SELECT key, value FROM cursorDiskKV WHERE key LIKE 'composerData:%'")
-
-        for key, value_blob in cursor.fetchall():
-            try:
-                if not value_blob:
-                    continue
-
-                composer_id = key.split(":")[1]
-                data = json.loads(value_blob)
-
-                created_at = data.get("createdAt")
-                if not created_at:
+        # Open read-only: no write locks or journal setup on a file Cursor may
+        # have open. (Not immutable=1, which would ignore a live WAL.)
+        db_uri = f"{db_path.resolve().as_uri()}?mode=ro"
+        with closing(sqlite3.connect(db_uri, uri=True)) as conn:
+            conn.execute("PRAGMA query_only=1")
+            # Let SQLite mmap the database and keep a larger page cache
+            conn.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+            conn.execute(f"PRAGMA cache_size={SQLITE_CACHE_SIZE}")
+
+            # Count messages (bubbles) per composer in SQL
+            message_counts: dict[str, int] = dict(conn.execute(BUBBLE_COUNTS_QUERY))
+
+            # Stream composer metadata rows
+            rows = conn.execute(
+                "SELECT key, value FROM cursorDiskKV WHERE key LIKE 'composerData:%'"
+            )
+            for key, value_blob in rows:
+                try:
+                    if not value_blob:
+                        continue
+
+                    composer_id = key.split(":")[1]
+                    data = jsonio.loads(value_blob)
+
+                    created_at = data.get("createdAt")
+                    if not created_at:
+                        continue
+
+                    timestamp = datetime.fromtimestamp(created_at / 1000, tz=timezone.utc)
+
+                    # Apply date filters
+                    if start_date and timestamp < start_date:
+                        continue
+                    if end_date and timestamp > end_date:
+                        continue
+
+                    # Get actual message count from bubbles
+                    turn_count = message_counts.get(composer_id, 1)
+                    mode = data.get("unifiedMode", "unknown")
+
+                    yield Session(
+                        id=composer_id,
+                        agent=AgentType.CURSOR,
+                        started_at=timestamp,
+                        turn_count=turn_count,
+                        user_message_count=turn_count // 2,  # Estimate
+                        assistant_message_count=turn_count // 2,
+                        # Cursor doesn't track per-repo like Claude/Codex
+                        repo=None,
+                        # Store mode in tools_used for Cursor-specific tracking
+                        tools_used={"cursor_mode": 1} if mode and mode != "unknown" else {},
+                    )
+
+                except (JSONDecodeError, KeyError, ValueError):
                     continue
 
-                timestamp = datetime.fromtimestamp(created_at / 1000, tz=timezone.utc)
-
-                # Apply date filters
-                if start_date and timestamp < start_date:
-                    continue
-                if end_date and timestamp > end_date:
-                    continue
-
-                # Get actual message count from bubbles
-                turn_count = message_counts.get(composer_id, 1)
-                mode = data.get("unifiedMode", "unknown")
-
-                yield Session(
-                    id=composer_id,
-                    agent=AgentType.CURSOR,
-                    started_at=timestamp,
-                    turn_count=turn_count,
-                    user_message_count=turn_count // 2,  # Estimate
-                    assistant_message_count=turn_count // 2,
-                    # Cursor doesn't track per-repo like Claude/Codex
-                    repo=None,
-                    # Store mode in tools_used for Cursor-specific tracking
-                    tools_used={"cursor_mode": 1} if mode and mode != "unknown" else {},
-                )
-
-            except (json.JSONDecodeError, KeyError, ValueError):
-                continue
-
-        conn.close()
-
     except sqlite3.Error:
         return
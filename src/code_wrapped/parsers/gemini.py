@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
-import json
-from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from json import JSONDecodeError
 from pathlib import Path
-from typing import Iterator
 
-from .base import AgentType, Session, parse_iso_timestamp, sanitize_prompt
+from .. import jsonio
+from .base import (
+    AgentType,
+    Session,
+    find_session_files,
+    parse_iso_timestamp,
+    sanitize_prompt,
+)
 
 
 def get_gemini_sessions_dir() -> Path:
@@ -16,6 +23,18 @@ def get_gemini_sessions_dir() -> Path:
     return Path.home() / ".gemini" / "tmp"
 
 
+@dataclass(slots=True)
+class _GeminiSession:
+    """Running totals for one session while its log messages are scanned."""
+
+    first_timestamp: datetime
+    last_timestamp: datetime
+    message_count: int = 0
+    user_count: int = 0
+    model_count: int = 0
+    user_prompts: list[str] = field(default_factory=list)
+
+
 def parse_gemini_sessions(
     sessions_dir: Path | None = None,
     year: int | None = None,
@@ -45,74 +64,67 @@ def parse_gemini_sessions(
     if year and not end_date:
         end_date = datetime(year, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
 
-    # Find all logs.json files
-    logs_files = list(sessions_dir.rglob("logs.json"))
-
-    # Group messages by session
-    sessions_data: dict[str, dict] = defaultdict(
-        lambda: {
-            "messages": [],
-            "user_prompts": [],
-            "first_timestamp": None,
-            "last_timestamp": None,
-        }
+    # Find all logs.json files (<tmp>/<project-hash>/logs.json)
+    logs_files = find_session_files(
+        sessions_dir, ("*/logs.json",), "logs.json", modified_after=start_date
     )
 
+    # Running totals per session, keyed by session ID
+    sessions_data: dict[str, _GeminiSession] = {}
+
     for logs_file in logs_files:
         try:
-            with open(logs_file) as f:
-                messages = json.load(f)
-
-            for msg in messages:
-                session_id = msg.get("sessionId")
-                timestamp_str = msg.get("timestamp")
-
-                if not session_id or not timestamp_str:
-                    continue
-
-                timestamp = parse_iso_timestamp(timestamp_str)
-                if not timestamp:
-                    continue
-
-                # Apply date filters at message level
-                if start_date and timestamp < start_date:
-                    continue
-                if end_date and timestamp > end_date:
-                    continue
-
-                session = sessions_data[session_id]
-                session["messages"].append(msg)
-
-                # Track timestamps
-                if session["first_timestamp"] is None or timestamp < session["first_timestamp"]:
-                    session["first_timestamp"] = timestamp
-                if session["last_timestamp"] is None or timestamp > session["last_timestamp"]:
-                    session["last_timestamp"] = timestamp
-
-                # Extract user prompts
-                if msg.get("type") == "user":
-                    content = msg.get("content", "")
-                    if content:
-                        session["user_prompts"].append(sanitize_prompt(content))
-
-        except (json.JSONDecodeError, Exception):
+            with open(logs_file, "rb") as f:
+                for msg in jsonio.iter_array(f):
+                    session_id = msg.get("sessionId")
+                    timestamp_str = msg.get("timestamp")
+
+                    if not session_id or not timestamp_str:
+                        continue
+
+                    # Message timestamps rarely repeat, so skip the parse cache
+                    timestamp = parse_iso_timestamp(timestamp_str, cache=False)
+                    if not timestamp:
+                        continue
+
+                    # Apply date filters at message level
+                    if start_date and timestamp < start_date:
+                        continue
+                    if end_date and timestamp > end_date:
+                        continue
+
+                    # Track timestamps
+                    session = sessions_data.get(session_id)
+                    if session is None:
+                        session = sessions_data[session_id] = _GeminiSession(timestamp, timestamp)
+                    elif timestamp < session.first_timestamp:
+                        session.first_timestamp = timestamp
+                    elif timestamp > session.last_timestamp:
+                        session.last_timestamp = timestamp
+
+                    # Count messages and extract user prompts
+                    session.message_count += 1
+                    msg_type = msg.get("type")
+                    if msg_type == "user":
+                        session.user_count += 1
+                        content = msg.get("content", "")
+                        if content:
+                            session.user_prompts.append(sanitize_prompt(content))
+                    elif msg_type == "model":
+                        session.model_count += 1
+
+        except (JSONDecodeError, Exception):
             continue
 
     # Convert to Session objects
     for session_id, data in sessions_data.items():
-        if not data["messages"] or not data["first_timestamp"]:
-            continue
-
-        user_count = sum(1 for m in data["messages"] if m.get("type") == "user")
-        assistant_count = sum(1 for m in data["messages"] if m.get("type") == "model")
-
         yield Session(
             id=session_id,
             agent=AgentType.GEMINI,
-            started_at=data["first_timestamp"],
-            ended_at=data["last_timestamp"],
-            turn_count=len(data["messages"]),
-            user_message_count=user_count,
-            assistant_message_count=assistant_count,
-            user_prompts=data["user_prompts"],
+            started_at=data.first_timestamp,
+            ended_at=data.last_timestamp,
+            turn_count=data.message_count,
+            user_message_count=data.user_count,
+            assistant_message_count=data.model_count,
+            user_prompts=data.user_prompts,
         )
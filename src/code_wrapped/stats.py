@@ -2,15 +2,59 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+from collections import Counter
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any
+from datetime import date, datetime
+from functools import cached_property
+from heapq import nlargest
+from operator import itemgetter
+from typing import Any, NamedTuple
+
+import numpy as np
 
 from .parsers.base import AgentType, Session
 
+# Agent order for SessionColumns.agent indices
+AGENT_TYPES = tuple(AgentType)
 
-@dataclass
+# One bit per weekday (0=Monday): Saturday and Sunday set.
+# Test with ``(WEEKEND_MASK >> weekday) & 1``; works elementwise on arrays.
+WEEKEND_MASK = 0b1100000
+
+
+def top_counts(counts: dict[str, int], n: int) -> dict[str, int]:
+    """Return the n highest counts, largest first (ties keep insertion order)."""
+    if not counts:
+        return {}
+    return dict(nlargest(n, counts.items(), key=itemgetter(1)))
+
+
+def sort_by_key(counts: dict[Any, int]) -> dict[Any, int]:
+    """Return counts reordered by key (hour or YYYY-MM-DD date)."""
+    # Sorting bare keys avoids building and comparing (key, count) tuples
+    return {key: counts[key] for key in sorted(counts)}
+
+
+class SessionColumns(NamedTuple):
+    """Column-oriented view of per-session numeric fields.
+
+    Index ``i`` in every array refers to ``WrappedStats.sessions[i]``, so a
+    pass over one attribute reads a contiguous array instead of chasing
+    a pointer per Session object.
+    """
+
+    duration_minutes: np.ndarray  # float64
+    turn_count: np.ndarray  # int64
+    hour_of_day: np.ndarray  # int8
+    day_of_week: np.ndarray  # int8 (0=Monday)
+    agent: np.ndarray  # int8 index into AGENT_TYPES
+    user_message_count: np.ndarray  # int64
+    assistant_message_count: np.ndarray  # int64
+    token_count: np.ndarray  # int64 (0 when unknown)
+    date_ordinal: np.ndarray  # int64 (date.toordinal() of the start date)
+
+
+@dataclass(slots=True)
 class AgentStats:
     """Statistics for a single agent."""
 
@@ -23,10 +67,10 @@ class AgentStats:
     total_duration_minutes: float = 0.0
 
     # Distributions
-    repos: dict[str, int] = field(default_factory=dict)
-    tools_used: dict[str, int] = field(default_factory=dict)
-    hours_distribution: dict[int, int] = field(default_factory=dict)
-    daily_sessions: dict[str, int] = field(default_factory=dict)
+    repos: Counter[str] = field(default_factory=Counter)
+    tools_used: Counter[str] = field(default_factory=Counter)
+    hours_distribution: Counter[int] = field(default_factory=Counter)
+    daily_sessions: Counter[str] = field(default_factory=Counter)
 
     # Records
     longest_session_minutes: float = 0.0
@@ -64,10 +108,10 @@ class WrappedStats:
     total_duration_minutes: float = 0.0
 
     # Global distributions
-    all_repos: dict[str, int] = field(default_factory=dict)
-    all_tools: dict[str, int] = field(default_factory=dict)
-    hours_distribution: dict[int, int] = field(default_factory=dict)
-    daily_sessions: dict[str, int] = field(default_factory=dict)
+    all_repos: Counter[str] = field(default_factory=Counter)
+    all_tools: Counter[str] = field(default_factory=Counter)
+    hours_distribution: Counter[int] = field(default_factory=Counter)
+    daily_sessions: Counter[str] = field(default_factory=Counter)
 
     # Streaks
     longest_streak_days: int = 0
@@ -79,11 +123,44 @@ class WrappedStats:
     most_active_day_sessions: int = 0
     peak_hour: int = 0
 
-    # All sessions for detailed analysis
-    sessions: list[Session] = field(default_factory=list)
+    # All sessions for detailed analysis (the caller's list, not a copy)
+    sessions: list[Session] = field(default_factory=list, repr=False)
+
+    # Errors for "Error of the Year": occurrences of each error text, and
+    # the first session it appeared in
+    error_counts: Counter[str] = field(default_factory=Counter)
+    error_sessions: dict[str, str] = field(default_factory=dict)
+
+    @cached_property
+    def columns(self) -> SessionColumns:
+        """Column arrays for bulk scans over sessions, built once on first access."""
+        sessions = self.sessions
+        n = len(sessions)
+
+        def column(values, dtype) -> np.ndarray:
+            return np.fromiter(values, dtype=dtype, count=n)
+
+        agent_index = {agent: i for i, agent in enumerate(AGENT_TYPES)}
+        date_ordinal = column((s.date_ordinal for s in sessions), np.int64)
+        return SessionColumns(
+            duration_minutes=column((s.duration_minutes for s in sessions), np.float64),
+            turn_count=column((s.turn_count for s in sessions), np.int64),
+            hour_of_day=column((s.hour_of_day for s in sessions), np.int8),
+            # Ordinal 1 (0001-01-01) was a Monday
+            day_of_week=((date_ordinal - 1) % 7).astype(np.int8),
+            agent=column((agent_index[s.agent] for s in sessions), np.int8),
+            user_message_count=column((s.user_message_count for s in sessions), np.int64),
+            assistant_message_count=column((s.assistant_message_count for s in sessions), np.int64),
+            token_count=column((s.token_count or 0 for s in sessions), np.int64),
+            date_ordinal=date_ordinal,
+        )
 
-    # Errors for "Error of the Year"
-    all_errors: list[tuple[str, str]] = field(default_factory=list)  # (session_id, error)
+    @cached_property
+    def enrichment(self) -> dict[str, Any]:
+        """Enrichment data for JSON output, computed once on first access."""
+        if not self.sessions:
+            return {}
+        return self._compute_enrichment()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -106,24 +183,16 @@ class WrappedStats:
                     "tokens": stats.token_count,
                     "avg_turns_per_session": round(stats.avg_turns_per_session, 1),
                     "avg_duration_minutes": round(stats.avg_duration_minutes, 1),
-                    "top_repos": dict(
-                        sorted(stats.repos.items(), key=lambda x: x[1], reverse=True)[:5]
-                    ),
-                    "top_tools": dict(
-                        sorted(stats.tools_used.items(), key=lambda x: x[1], reverse=True)[:10]
-                    ),
+                    "top_repos": top_counts(stats.repos, 5),
+                    "top_tools": top_counts(stats.tools_used, 10),
                 }
                 for agent, stats in self.agent_stats.items()
             },
             "distributions": {
-                "by_hour": dict(sorted(self.hours_distribution.items())),
-                "by_day": dict(sorted(self.daily_sessions.items())),
-                "by_repo": dict(
-                    sorted(self.all_repos.items(), key=lambda x: x[1], reverse=True)[:10]
-                ),
-                "by_tool": dict(
-                    sorted(self.all_tools.items(), key=lambda x: x[1], reverse=True)[:15]
-                ),
+                "by_hour": sort_by_key(self.hours_distribution),
+                "by_day": sort_by_key(self.daily_sessions),
+                "by_repo": top_counts(self.all_repos, 10),
+                "by_tool": top_counts(self.all_tools, 15),
             },
             "records": {
                 "most_active_day": self.most_active_day,
@@ -134,7 +203,7 @@ class WrappedStats:
 
         # Add enrichment data if sessions available
         if self.sessions:
-            result["enrichment"] = self._compute_enrichment()
+            result["enrichment"] = self.enrichment
 
         return result
 
@@ -238,8 +307,6 @@ def compute_streaks(daily_sessions: dict[str, int]) -> tuple[int, int, int]:
     if not daily_sessions:
         return 0, 0, 0
 
-    from datetime import datetime, timedelta
-
     # Get all dates with sessions
     active_dates = sorted([d for d, count in daily_sessions.items() if count > 0])
     active_days = len(active_dates)
@@ -247,34 +314,38 @@ def compute_streaks(daily_sessions: dict[str, int]) -> tuple[int, int, int]:
     if not active_dates:
         return 0, 0, 0
 
-    # Parse dates
-    date_objects = [datetime.strptime(d, "%Y-%m-%d").date() for d in active_dates]
+    # Day gaps between consecutive active dates; any gap other than 1 ends a run
+    dates = np.array(active_dates, dtype="datetime64[D]")
+    breaks = np.flatnonzero(np.diff(dates) != np.timedelta64(1, "D")) + 1
 
-    # Compute longest streak by checking consecutive days
-    longest_streak = 1
-    temp_streak = 1
+    # Run lengths from the run boundaries
+    bounds = np.concatenate(([0], breaks, [active_days]))
+    run_lengths = np.diff(bounds)
 
-    for i in range(1, len(date_objects)):
-        if (date_objects[i] - date_objects[i - 1]).days == 1:
-            temp_streak += 1
-            longest_streak = max(longest_streak, temp_streak)
-        else:
-            temp_streak = 1
+    # Longest run overall; current streak is the run ending on the most recent day
+    return int(run_lengths.max()), int(run_lengths[-1]), active_days
 
-    # Current streak (from most recent active day backwards)
-    current_streak = 1
-    for i in range(len(date_objects) - 1, 0, -1):
-        if (date_objects[i] - date_objects[i - 1]).days == 1:
-            current_streak += 1
-        else:
-            break
 
-    return longest_streak, current_streak, active_days
+def counts_by_first_seen(values: np.ndarray, key=None) -> Counter:
+    """Count array values, keyed in order of first appearance like a running Counter.
+
+    key, if given, maps each distinct value to the Counter key.
+    """
+    keys, first_index, counts = np.unique(values, return_index=True, return_counts=True)
+    order = np.argsort(first_index)
+    keys = keys[order].tolist()
+    if key is not None:
+        keys = map(key, keys)
+    return Counter(dict(zip(keys, counts[order].tolist())))
 
 
 def aggregate_stats(sessions: list[Session], year: int) -> WrappedStats:
     """Aggregate statistics from all sessions.
 
+    Numeric fields are reduced over the ``WrappedStats.columns`` arrays;
+    only the string-keyed distributions (repos, tools) and errors need a
+    Python loop over the sessions.
+
     Args:
         sessions: List of Session objects from all agents
         year: The year being analyzed
@@ -292,52 +363,83 @@ def aggregate_stats(sessions: list[Session], year: int) -> WrappedStats:
     for agent in AgentType:
         stats.agent_stats[agent] = AgentStats(agent=agent)
 
-    # Process each session
+    # Bind the global distributions once for the loop
+    all_repos = stats.all_repos
+    all_tools = stats.all_tools
+    error_counts = stats.error_counts
+    error_sessions = stats.error_sessions
+
+    # String-keyed distributions and errors
     for session in sessions:
         agent_stats = stats.agent_stats[session.agent]
 
-        # Counts
-        agent_stats.session_count += 1
-        agent_stats.turn_count += session.turn_count
-        agent_stats.user_message_count += session.user_message_count
-        agent_stats.assistant_message_count += session.assistant_message_count
-        agent_stats.total_duration_minutes += session.duration_minutes
-
-        if session.token_count:
-            agent_stats.token_count += session.token_count
-
         # Repo tracking
-        if session.repo:
-            agent_stats.repos[session.repo] = agent_stats.repos.get(session.repo, 0) + 1
-            stats.all_repos[session.repo] = stats.all_repos.get(session.repo, 0) + 1
+        repo = session.repo
+        if repo:
+            agent_stats.repos[repo] += 1
+            all_repos[repo] += 1
 
         # Tool tracking
-        for tool, count in session.tools_used.items():
-            agent_stats.tools_used[tool] = agent_stats.tools_used.get(tool, 0) + count
-            stats.all_tools[tool] = stats.all_tools.get(tool, 0) + count
-
-        # Hour distribution
-        hour = session.hour_of_day
-        agent_stats.hours_distribution[hour] = agent_stats.hours_distribution.get(hour, 0) + 1
-        stats.hours_distribution[hour] = stats.hours_distribution.get(hour, 0) + 1
-
-        # Daily sessions
-        date = session.date_str
-        agent_stats.daily_sessions[date] = agent_stats.daily_sessions.get(date, 0) + 1
-        stats.daily_sessions[date] = stats.daily_sessions.get(date, 0) + 1
-
-        # Records
-        if session.duration_minutes > agent_stats.longest_session_minutes:
-            agent_stats.longest_session_minutes = session.duration_minutes
-            agent_stats.longest_session_id = session.id
-
-        if session.turn_count > agent_stats.most_turns_session:
-            agent_stats.most_turns_session = session.turn_count
-            agent_stats.most_turns_session_id = session.id
+        tools = session.tools_used
+        if tools:
+            agent_tools = agent_stats.tools_used
+            for tool, count in tools.items():
+                agent_tools[tool] += count
+                all_tools[tool] += count
 
         # Errors
-        for error in session.errors:
-            stats.all_errors.append((session.id, error))
+        errors = session.errors
+        if errors:
+            error_counts.update(errors)
+            session_id = session.id
+            for error in errors:
+                error_sessions.setdefault(error, session_id)
+
+    if sessions:
+        columns = stats.columns
+
+        # Date strings for each distinct start date
+        day_names = {
+            ordinal: date.fromordinal(ordinal).isoformat()
+            for ordinal in np.unique(columns.date_ordinal).tolist()
+        }
+        day_name = day_names.__getitem__
+
+        for index, agent in enumerate(AGENT_TYPES):
+            rows = np.flatnonzero(columns.agent == index)
+            if not len(rows):
+                continue
+            agent_stats = stats.agent_stats[agent]
+            durations = columns.duration_minutes[rows]
+            turns = columns.turn_count[rows]
+
+            # Counts
+            agent_stats.session_count = len(rows)
+            agent_stats.turn_count = int(turns.sum())
+            agent_stats.user_message_count = int(columns.user_message_count[rows].sum())
+            agent_stats.assistant_message_count = int(columns.assistant_message_count[rows].sum())
+            agent_stats.total_duration_minutes = float(durations.sum())
+            agent_stats.token_count = int(columns.token_count[rows].sum())
+
+            # Hour and daily distributions
+            agent_stats.hours_distribution = counts_by_first_seen(columns.hour_of_day[rows])
+            agent_stats.daily_sessions = counts_by_first_seen(
+                columns.date_ordinal[rows], key=day_name
+            )
+
+            # Records: first session reaching the maximum, if above zero
+            longest = int(durations.argmax())
+            if durations[longest] > 0:
+                agent_stats.longest_session_minutes = float(durations[longest])
+                agent_stats.longest_session_id = sessions[rows[longest]].id
+
+            most_turns = int(turns.argmax())
+            if turns[most_turns] > 0:
+                agent_stats.most_turns_session = int(turns[most_turns])
+                agent_stats.most_turns_session_id = sessions[rows[most_turns]].id
+
+        stats.hours_distribution = counts_by_first_seen(columns.hour_of_day)
+        stats.daily_sessions = counts_by_first_seen(columns.date_ordinal, key=day_name)
 
     # Compute totals
     for agent_stats in stats.agent_stats.values():
@@ -353,12 +455,12 @@ def aggregate_stats(sessions: list[Session], year: int) -> WrappedStats:
 
     # Find most active day
     if stats.daily_sessions:
-        most_active = max(stats.daily_sessions.items(), key=lambda x: x[1])
+        most_active = stats.daily_sessions.most_common(1)[0]
         stats.most_active_day = most_active[0]
         stats.most_active_day_sessions = most_active[1]
 
     # Find peak hour
     if stats.hours_distribution:
-        stats.peak_hour = max(stats.hours_distribution.items(), key=lambda x: x[1])[0]
+        stats.peak_hour = stats.hours_distribution.most_common(1)[0][0]
 
     return stats
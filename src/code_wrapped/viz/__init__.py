@@ -1,7 +1,12 @@
 """Visualization modules."""
 
 from .cards import generate_all_cards, generate_hero_card, generate_tool_fingerprint_card
-from .charts import generate_all_charts, generate_activity_heatmap, save_chart_as_png
+from .charts import (
+    generate_activity_heatmap,
+    generate_all_charts,
+    save_all_charts,
+    save_chart_as_png,
+)
 
 __all__ = [
     'generate_all_cards',
@@ -10,4 +15,5 @@ __all__ = [
     'generate_all_charts',
     'generate_activity_heatmap',
     'save_chart_as_png',
+    'save_all_charts',
 ]
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 
+from ..parsers.base import AgentType
 from ..stats import WrappedStats
 
 
@@ -14,6 +18,10 @@ from ..stats import WrappedStats
 CARD_WIDTH = 1200
 CARD_HEIGHT = 630  # Twitter/OpenGraph optimal size
 
+# PNG zlib level for saved cards: level 1 encodes ~1.5x faster than the
+# default 6; the flat dark cards stay small (~20 KB) either way
+PNG_COMPRESS_LEVEL = 1
+
 # Color palette
 COLORS = {
     'background': '#0F1419',
@@ -25,10 +33,12 @@ COLORS = {
 }
 
 
+@cache
 def get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
     """Get a font for rendering text.
 
-    Falls back to default font if custom fonts not available.
+    Falls back to default font if custom fonts not available. Fonts are
+    cached per (size, bold), so each face is loaded only once per run.
 
     Args:
         size: Font size
@@ -47,17 +57,45 @@ def get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
         return ImageFont.load_default()
 
 
+@lru_cache(maxsize=64)
 def hex_to_rgb(hex_color: str) -> tuple[int, int, int]:
     """Convert hex color to RGB tuple.
 
     Args:
-        hex_color: Hex color string like '#FFFFFF'
+        hex_color: Hex color string like '#FFFFFF' or '#FFF' (the '#' is optional)
 
     Returns:
         RGB tuple
     """
-    hex_color = hex_color.lstrip('#')
-    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    return ImageColor.getrgb('#' + hex_color.lstrip('#'))
+
+
+# Palette as RGB tuples, converted once
+COLORS_RGB = {name: hex_to_rgb(color) for name, color in COLORS.items()}
+
+# Agent bar colors for the comparison card
+AGENT_COLORS_RGB = {
+    AgentType.CLAUDE: hex_to_rgb('#5436DA'),
+    AgentType.CODEX: hex_to_rgb('#10A37F'),
+    AgentType.CURSOR: hex_to_rgb('#000000'),
+    AgentType.GEMINI: hex_to_rgb('#4285F4'),
+}
+
+
+@lru_cache(maxsize=1024)
+def text_width(text: str, font: ImageFont.FreeTypeFont) -> int:
+    """Measure the rendered width of text, once per (text, font) pair.
+
+    Args:
+        text: Text to measure
+        font: Font to measure with (fonts from get_font are shared, so
+            repeated labels hit the cache)
+
+    Returns:
+        Advance width of the text in pixels (getlength skips the ink
+        bounding box that textbbox computes)
+    """
+    return int(font.getlength(text))
 
 
 def draw_text_centered(
@@ -78,9 +116,7 @@ def draw_text_centered(
         color: Color hex string
         width: Width of the canvas for centering
     """
-    bbox = draw.textbbox((0, 0), text, font=font)
-    text_width = bbox[2] - bbox[0]
-    x = (width - text_width) // 2
+    x = (width - text_width(text, font)) // 2
     draw.text((x, y), text, font=font, fill=hex_to_rgb(color))
 
 
@@ -95,7 +131,7 @@ def generate_hero_card(stats: WrappedStats) -> Image.Image:
     Returns:
         PIL Image object
     """
-    img = Image.new('RGB', (CARD_WIDTH, CARD_HEIGHT), color=hex_to_rgb(COLORS['background']))
+    img = Image.new('RGB', (CARD_WIDTH, CARD_HEIGHT), color=COLORS_RGB['background'])
     draw = ImageDraw.Draw(img)
 
     # Title
@@ -143,14 +179,14 @@ def generate_hero_card(stats: WrappedStats) -> Image.Image:
         y = start_y + row * row_height
 
         # Draw value
-        bbox = draw.textbbox((0, 0), value, font=stats_font)
-        value_width = bbox[2] - bbox[0]
-        draw.text((x - value_width // 2, y), value, font=stats_font, fill=hex_to_rgb(COLORS['primary']))
+        value_width = text_width(value, stats_font)
+        draw.text((x - value_width // 2, y), value, font=stats_font, fill=COLORS_RGB['primary'])
 
         # Draw label
-        bbox = draw.textbbox((0, 0), label, font=label_font)
-        label_width = bbox[2] - bbox[0]
-        draw.text((x - label_width // 2, y + 70), label, font=label_font, fill=hex_to_rgb(COLORS['text_dim']))
+        label_width = text_width(label, label_font)
+        draw.text(
+            (x - label_width // 2, y + 70), label, font=label_font, fill=COLORS_RGB['text_dim']
+        )
 
     # Footer
     footer_font = get_font(20)
@@ -171,7 +207,7 @@ def generate_tool_fingerprint_card(stats: WrappedStats, fingerprint: dict[str, A
     Returns:
         PIL Image object
     """
-    img = Image.new('RGB', (CARD_WIDTH, CARD_HEIGHT), color=hex_to_rgb(COLORS['background']))
+    img = Image.new('RGB', (CARD_WIDTH, CARD_HEIGHT), color=COLORS_RGB['background'])
     draw = ImageDraw.Draw(img)
 
     # Title
@@ -209,19 +245,21 @@ def generate_tool_fingerprint_card(stats: WrappedStats, fingerprint: dict[str, A
             percentage = tool['percentage']
 
             # Draw tool name
-            draw.text((label_x, y + 10), name, font=tool_font, fill=hex_to_rgb(COLORS['text']))
+            draw.text((label_x, y + 10), name, font=tool_font, fill=COLORS_RGB['text'])
 
             # Draw percentage bar
             bar_x = label_x + 200
             bar_width = int((percentage / 100) * bar_max_width)
             draw.rectangle(
                 [bar_x, y + 5, bar_x + bar_width, y + bar_height - 5],
-                fill=hex_to_rgb(COLORS['secondary']),
+                fill=COLORS_RGB['secondary'],
             )
 
             # Draw percentage text
             pct_text = f"{percentage:.1f}%"
-            draw.text((bar_x + bar_width + 15, y + 10), pct_text, font=tool_font, fill=hex_to_rgb(COLORS['text']))
+            draw.text(
+                (bar_x + bar_width + 15, y + 10), pct_text, font=tool_font, fill=COLORS_RGB['text']
+            )
 
     return img
 
@@ -237,7 +275,7 @@ def generate_agent_comparison_card(stats: WrappedStats) -> Image.Image:
     Returns:
         PIL Image object
     """
-    img = Image.new('RGB', (CARD_WIDTH, CARD_HEIGHT), color=hex_to_rgb(COLORS['background']))
+    img = Image.new('RGB', (CARD_WIDTH, CARD_HEIGHT), color=COLORS_RGB['background'])
     draw = ImageDraw.Draw(img)
 
     # Title
@@ -249,25 +287,16 @@ def generate_agent_comparison_card(stats: WrappedStats) -> Image.Image:
     draw_text_centered(draw, "Which agents did you work with most?", 150, subtitle_font, COLORS['text_dim'])
 
     # Collect agent data
-    agent_colors = {
-        'claude': '#5436DA',
-        'codex': '#10A37F',
-        'cursor': '#000000',
-        'gemini': '#4285F4',
-    }
-
     agents_data = []
-    for agent in ['claude', 'codex', 'cursor', 'gemini']:
-        from ..parsers.base import AgentType
-        agent_enum = AgentType(agent)
-        agent_stats = stats.agent_stats.get(agent_enum)
+    for agent in AgentType:
+        agent_stats = stats.agent_stats.get(agent)
         if agent_stats and agent_stats.session_count > 0:
             percentage = (agent_stats.session_count / stats.total_sessions) * 100
             agents_data.append({
-                'name': agent.title(),
+                'name': agent.value.title(),
                 'sessions': agent_stats.session_count,
                 'percentage': percentage,
-                'color': agent_colors.get(agent, COLORS['primary']),
+                'color': AGENT_COLORS_RGB.get(agent, COLORS_RGB['primary']),
             })
 
     # Sort by usage
@@ -288,19 +317,19 @@ def generate_agent_comparison_card(stats: WrappedStats) -> Image.Image:
             y = bar_start_y + i * (bar_height + bar_spacing)
 
             # Draw agent name
-            draw.text((label_x, y + 5), agent['name'], font=agent_font, fill=hex_to_rgb(COLORS['text']))
+            draw.text((label_x, y + 5), agent['name'], font=agent_font, fill=COLORS_RGB['text'])
 
             # Draw bar
             bar_x = label_x + 150
             bar_width = int((agent['percentage'] / 100) * bar_max_width)
             draw.rectangle(
                 [bar_x, y + 10, bar_x + bar_width, y + bar_height - 10],
-                fill=hex_to_rgb(agent['color']),
+                fill=agent['color'],
             )
 
             # Draw stats
             stats_text = f"{agent['sessions']:,} sessions ({agent['percentage']:.1f}%)"
-            draw.text((bar_x + 10, y + 20), stats_text, font=detail_font, fill=hex_to_rgb(COLORS['text']))
+            draw.text((bar_x + 10, y + 20), stats_text, font=detail_font, fill=COLORS_RGB['text'])
 
     return img
 
@@ -317,7 +346,7 @@ def generate_award_card(award_name: str, award_emoji: str, award_detail: str, ye
     Returns:
         PIL Image object
     """
-    img = Image.new('RGB', (CARD_WIDTH, CARD_HEIGHT), color=hex_to_rgb(COLORS['background']))
+    img = Image.new('RGB', (CARD_WIDTH, CARD_HEIGHT), color=COLORS_RGB['background'])
     draw = ImageDraw.Draw(img)
 
     # Title
@@ -338,21 +367,18 @@ def generate_award_card(award_name: str, award_emoji: str, award_detail: str, ye
 
     # Detail
     detail_font = get_font(28)
-    # Wrap detail text if needed
-    if len(award_detail) > 60:
-        # Split into two lines
-        words = award_detail.split()
-        mid = len(words) // 2
-        line1 = ' '.join(words[:mid])
-        line2 = ' '.join(words[mid:])
-        draw_text_centered(draw, line1, 440, detail_font, COLORS['text'])
-        draw_text_centered(draw, line2, 480, detail_font, COLORS['text'])
-    else:
-        draw_text_centered(draw, award_detail, 440, detail_font, COLORS['text'])
+    # Wrap detail text at word boundaries, 60 characters per line
+    for i, line in enumerate(textwrap.wrap(award_detail, width=60)):
+        draw_text_centered(draw, line, 440 + i * 40, detail_font, COLORS['text'])
 
     return img
 
 
+def _save_png(image: Image.Image, path: Path) -> None:
+    """Save a card as PNG with the card compression settings."""
+    image.save(path, format='PNG', compress_level=PNG_COMPRESS_LEVEL)
+
+
 def generate_all_cards(
     stats: WrappedStats,
     enrichment: dict[str, Any],
@@ -369,27 +395,20 @@ def generate_all_cards(
         List of paths to generated cards
     """
     output_dir.mkdir(parents=True, exist_ok=True)
-    generated = []
+    cards: list[tuple[Image.Image, Path]] = []
 
     # Hero card
-    hero = generate_hero_card(stats)
-    hero_path = output_dir / "hero-stats.png"
-    hero.save(hero_path)
-    generated.append(hero_path)
+    cards.append((generate_hero_card(stats), output_dir / "hero-stats.png"))
 
     # Tool fingerprint card
     if enrichment.get('fingerprint'):
         tool_card = generate_tool_fingerprint_card(stats, enrichment['fingerprint'])
-        tool_path = output_dir / "tool-fingerprint.png"
-        tool_card.save(tool_path)
-        generated.append(tool_path)
+        cards.append((tool_card, output_dir / "tool-fingerprint.png"))
 
     # Agent comparison card
     if stats.total_sessions > 0:
         agent_card = generate_agent_comparison_card(stats)
-        agent_path = output_dir / "agent-comparison.png"
-        agent_card.save(agent_path)
-        generated.append(agent_path)
+        cards.append((agent_card, output_dir / "agent-comparison.png"))
 
     # Award cards (up to 3)
     awards = enrichment.get('awards', [])
@@ -400,8 +419,12 @@ def generate_all_cards(
             award['detail'],
             stats.year,
         )
-        award_path = output_dir / f"award-{award['id']}.png"
-        award_card.save(award_path)
-        generated.append(award_path)
+        cards.append((award_card, output_dir / f"award-{award['id']}.png"))
+
+    # Rendering shares the cached fonts, so it stays serial above; PNG
+    # encoding releases the GIL, so the cards are saved in parallel
+    images, paths = zip(*cards)
+    with ThreadPoolExecutor(max_workers=len(cards)) as pool:
+        list(pool.map(_save_png, images, paths))
 
-    return generated
+    return list(paths)
@@ -3,15 +3,47 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+import numpy as np
 
-from ..stats import WrappedStats
+from ..stats import WrappedStats, top_counts
 from ..parsers.base import AgentType
 
+# Plotly is imported inside the chart functions: it takes ~50 ms to import
+# and card-only code paths (viz.cards) never need it
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+
+def _weekday_totals(daily_sessions: dict[str, int]) -> np.ndarray:
+    """Sum daily session counts by day of week (Sunday=0 to Saturday=6).
+
+    Dates are parsed in bulk as datetime64; if any key is malformed, the
+    dates are parsed one by one instead and the bad ones skipped.
+    """
+    if not daily_sessions:
+        return np.zeros(7)
+
+    try:
+        days = np.array(list(daily_sessions), dtype='datetime64[D]')
+    except ValueError:
+        from datetime import date
+
+        day_totals = np.zeros(7)
+        for date_str, count in daily_sessions.items():
+            try:
+                day_of_week = (date.fromisoformat(date_str).weekday() + 1) % 7
+            except ValueError:
+                continue
+            day_totals[day_of_week] += count
+        return day_totals
+
+    counts = np.fromiter(daily_sessions.values(), dtype=np.float64, count=len(days))
+    # Day 0 of datetime64 (1970-01-01) was a Thursday
+    day_of_week = (days.view(np.int64) + 4) % 7
+    return np.bincount(day_of_week, weights=counts, minlength=7)
+
 
 def generate_activity_heatmap(stats: WrappedStats) -> go.Figure:
     """Generate a heatmap of coding activity by hour and day of week.
@@ -22,30 +54,20 @@ def generate_activity_heatmap(stats: WrappedStats) -> go.Figure:
     Returns:
         Plotly figure object
     """
-    import calendar
-    from datetime import datetime
-
-    # Create day of week x hour matrix
-    # Initialize 7x24 grid (Sunday=0 to Saturday=6, hours 0-23)
-    activity = [[0 for _ in range(24)] for _ in range(7)]
-
-    # Populate from daily sessions
-    for date_str, count in stats.daily_sessions.items():
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-            day_of_week = date.weekday()  # Monday=0
-            # Convert to Sunday=0 format
-            day_of_week = (day_of_week + 1) % 7
-
-            # Get hour distribution for this day if available
-            # For now, use the overall hour distribution weighted by this day's sessions
-            if stats.hours_distribution:
-                total_hour_sessions = sum(stats.hours_distribution.values())
-                for hour, hour_count in stats.hours_distribution.items():
-                    weight = hour_count / total_hour_sessions if total_hour_sessions > 0 else 0
-                    activity[day_of_week][hour] += count * weight
-        except ValueError:
-            continue
+    import plotly.graph_objects as go
+
+    # Share of sessions in each hour (0-23)
+    hour_weights = np.zeros(24)
+    total_hour_sessions = sum(stats.hours_distribution.values())
+    if total_hour_sessions > 0:
+        for hour, hour_count in stats.hours_distribution.items():
+            hour_weights[hour] = hour_count / total_hour_sessions
+
+    # Total sessions per day of week (Sunday=0 to Saturday=6)
+    day_totals = _weekday_totals(stats.daily_sessions)
+
+    # Spread each day's sessions over the overall hour distribution: 7x24 grid
+    activity = np.outer(day_totals, hour_weights)
 
     # Create labels
     days = ['Sun', 'Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat']
@@ -53,20 +75,18 @@ def generate_activity_heatmap(stats: WrappedStats) -> go.Figure:
 
     # Create heatmap
     fig = go.Figure(data=go.Heatmap(
-        z=activity,
+        z=activity.tolist(),  # Plain lists: plotly 5.x to_dict() keeps ndarrays
         x=hours,
         y=days,
         colorscale='Viridis',
         hovertemplate='%{y} at %{x}<br>Sessions: %{z:.1f}<extra></extra>',
-    ))
-
-    fig.update_layout(
+    ), layout=dict(
         title=f'Your Coding Activity Pattern - {stats.year}',
         xaxis_title='Hour of Day',
         yaxis_title='Day of Week',
         height=400,
         font=dict(size=12),
-    )
+    ))
 
     return fig
 
@@ -80,6 +100,8 @@ def generate_hourly_distribution(stats: WrappedStats) -> go.Figure:
     Returns:
         Plotly figure object
     """
+    import plotly.graph_objects as go
+
     hours = list(range(24))
     counts = [stats.hours_distribution.get(h, 0) for h in hours]
 
@@ -90,15 +112,13 @@ def generate_hourly_distribution(stats: WrappedStats) -> go.Figure:
             marker_color='rgb(55, 83, 109)',
             hovertemplate='%{x}:00<br>Sessions: %{y}<extra></extra>',
         )
-    ])
-
-    fig.update_layout(
+    ], layout=dict(
         title='Sessions by Hour of Day',
         xaxis_title='Hour',
         yaxis_title='Session Count',
         xaxis=dict(tickmode='linear', tick0=0, dtick=2),
         height=400,
-    )
+    ))
 
     return fig
 
@@ -113,14 +133,16 @@ def generate_tool_usage_chart(stats: WrappedStats, top_n: int = 10) -> go.Figure
     Returns:
         Plotly figure object
     """
+    import plotly.graph_objects as go
+
     # Get top tools
-    sorted_tools = sorted(stats.all_tools.items(), key=lambda x: x[1], reverse=True)[:top_n]
+    top_tools = top_counts(stats.all_tools, top_n)
 
-    if not sorted_tools:
+    if not top_tools:
         # Return empty figure
         return go.Figure()
 
-    tools, counts = zip(*sorted_tools)
+    tools, counts = zip(*top_tools.items())
 
     # Reverse for horizontal bar (top to bottom)
     tools = tools[::-1]
@@ -134,15 +156,13 @@ def generate_tool_usage_chart(stats: WrappedStats, top_n: int = 10) -> go.Figure
             marker_color='rgb(26, 118, 255)',
             hovertemplate='%{y}<br>Uses: %{x}<extra></extra>',
         )
-    ])
-
-    fig.update_layout(
+    ], layout=dict(
         title='Your Tool Fingerprint',
         xaxis_title='Number of Uses',
         yaxis_title='Tool',
         height=max(400, len(tools) * 40),
         showlegend=False,
-    )
+    ))
 
     return fig
 
@@ -156,9 +176,8 @@ def generate_agent_comparison_chart(stats: WrappedStats) -> go.Figure:
     Returns:
         Plotly figure object
     """
-    # Collect agent data
-    labels = []
-    values = []
+    import plotly.graph_objects as go
+
     colors = {
         AgentType.CLAUDE: '#5436DA',  # Claude purple
         AgentType.CODEX: '#10A37F',   # OpenAI green
@@ -166,17 +185,17 @@ def generate_agent_comparison_chart(stats: WrappedStats) -> go.Figure:
         AgentType.GEMINI: '#4285F4',  # Google blue
     }
 
-    for agent in AgentType:
-        agent_stats = stats.agent_stats.get(agent)
-        if agent_stats and agent_stats.session_count > 0:
-            labels.append(agent.value.title())
-            values.append(agent_stats.session_count)
+    # Collect (label, sessions, color) for each agent that was used
+    agents = [
+        (agent.value.title(), agent_stats.session_count, colors.get(agent, '#999999'))
+        for agent in AgentType
+        if (agent_stats := stats.agent_stats.get(agent)) and agent_stats.session_count > 0
+    ]
 
-    if not labels:
+    if not agents:
         return go.Figure()
 
-    # Get colors in same order
-    color_list = [colors.get(AgentType(label.lower()), '#999999') for label in labels]
+    labels, values, color_list = zip(*agents)
 
     fig = go.Figure(data=[
         go.Pie(
@@ -186,12 +205,10 @@ def generate_agent_comparison_chart(stats: WrappedStats) -> go.Figure:
             marker=dict(colors=color_list),
             hovertemplate='%{label}<br>%{value} sessions (%{percent})<extra></extra>',
         )
-    ])
-
-    fig.update_layout(
+    ], layout=dict(
         title='Agent Usage Distribution',
         height=400,
-    )
+    ))
 
     return fig
 
@@ -205,6 +222,8 @@ def generate_topic_distribution_chart(topics_data: list[dict]) -> go.Figure:
     Returns:
         Plotly figure object
     """
+    import plotly.graph_objects as go
+
     if not topics_data:
         return go.Figure()
 
@@ -219,15 +238,13 @@ def generate_topic_distribution_chart(topics_data: list[dict]) -> go.Figure:
             marker_color='rgb(99, 110, 250)',
             hovertemplate='%{y}<br>%{x:.1f}% of sessions<extra></extra>',
         )
-    ])
-
-    fig.update_layout(
+    ], layout=dict(
         title='Your Top Coding Topics',
         xaxis_title='Percentage of Sessions',
         yaxis_title='Topic',
         height=max(350, len(names) * 50),
         showlegend=False,
-    )
+    ))
 
     return fig
 
@@ -242,12 +259,14 @@ def generate_repo_distribution_chart(stats: WrappedStats, top_n: int = 8) -> go.
     Returns:
         Plotly figure object
     """
-    sorted_repos = sorted(stats.all_repos.items(), key=lambda x: x[1], reverse=True)[:top_n]
+    import plotly.graph_objects as go
 
-    if not sorted_repos:
+    top_repos = top_counts(stats.all_repos, top_n)
+
+    if not top_repos:
         return go.Figure()
 
-    repos, counts = zip(*sorted_repos)
+    repos, counts = zip(*top_repos.items())
 
     # Reverse for horizontal bar
     repos = repos[::-1]
@@ -261,21 +280,27 @@ def generate_repo_distribution_chart(stats: WrappedStats, top_n: int = 8) -> go.
             marker_color='rgb(239, 85, 59)',
             hovertemplate='%{y}<br>Sessions: %{x}<extra></extra>',
         )
-    ])
-
-    fig.update_layout(
+    ], layout=dict(
         title='Your Most Active Repositories',
         xaxis_title='Session Count',
         yaxis_title='Repository',
         height=max(350, len(repos) * 50),
         showlegend=False,
-    )
+    ))
 
     return fig
 
 
+def _export_height(fig: go.Figure, height: int) -> int:
+    """Return the PNG export height, preferring the figure's own height over the default."""
+    layout_height = fig.layout.height
+    if layout_height and height == 800:  # Only override if default
+        return int(layout_height)
+    return height
+
+
 def save_chart_as_png(fig: go.Figure, output_path: Path, width: int = 1200, height: int = 800) -> None:
-    """Save a Plotly figure as PNG using kaleido.
+    """Save a Plotly figure as PNG using kaleido (the ``export`` extra).
 
     Args:
         fig: Plotly figure
@@ -284,13 +309,52 @@ def save_chart_as_png(fig: go.Figure, output_path: Path, width: int = 1200, heig
         height: Image height in pixels (None to use figure's height)
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    fig.write_image(str(output_path), width=width, height=_export_height(fig, height), scale=2)
 
-    # Use figure's height if it has one
-    layout_height = fig.layout.height
-    if layout_height and height == 800:  # Only override if default
-        height = int(layout_height)
 
-    fig.write_image(str(output_path), width=width, height=height, scale=2)
+def save_all_charts(
+    charts: dict[str, go.Figure],
+    output_dir: Path,
+    width: int = 1200,
+    height: int = 800,
+) -> dict[str, Path]:
+    """Save several Plotly figures as PNGs in one kaleido session.
+
+    Prefer this over calling save_chart_as_png in a loop: with kaleido 1.x
+    (plotly.io.write_images) the browser is started once for the whole
+    batch. Older plotly/kaleido fall back to one write_image per figure.
+
+    Args:
+        charts: Dictionary of chart name to Plotly figure
+        output_dir: Directory to save PNG files (as <name>.png)
+        width: Image width in pixels
+        height: Image height in pixels (figures with their own height keep it)
+
+    Returns:
+        Dictionary mapping chart names to saved paths
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = {name: output_dir / f"{name}.png" for name in charts}
+    if not charts:
+        return paths
+
+    import plotly.io as pio
+
+    write_images = getattr(pio, 'write_images', None)
+    if write_images is None:
+        for name, fig in charts.items():
+            save_chart_as_png(fig, paths[name], width=width, height=height)
+        return paths
+
+    figs = list(charts.values())
+    write_images(
+        figs,
+        list(paths.values()),
+        width=width,
+        height=[_export_height(fig, height) for fig in figs],
+        scale=2,
+    )
+    return paths
 
 
 def generate_all_charts(stats: WrappedStats, enrichment: dict[str, Any]) -> dict[str, go.Figure]:
@@ -2,7 +2,7 @@
 
 import sys
 from datetime import datetime, timezone
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
@@ -19,10 +19,10 @@ from code_wrapped.stats import AgentStats, WrappedStats, aggregate_stats
 # ===========================
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_sessions():
     """Create sample sessions for testing."""
-    return [
+    return (
         Session(
             id="session-1",
             agent=AgentType.CLAUDE,
@@ -65,19 +65,22 @@ def sample_sessions():
             tools_used={"Bash": 2, "Edit": 1},
             user_prompts=["Quick fix for the bug"],
         ),
-    ]
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_stats(sample_sessions):
-    """Generate stats from sample sessions."""
+    """Generate stats from sample sessions.
+
+    Module-scoped and shared by every test here, so tests must not mutate it.
+    """
     return aggregate_stats(sample_sessions, 2025)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_awards():
     """Create sample awards."""
-    return [
+    return (
         Award(
             id="night_owl",
             name="Night Owl",
@@ -94,7 +97,7 @@ def sample_awards():
             detail="Longest session: 4.2 hours on Claude",
             value=4.2,
         ),
-    ]
+    )
 
 
 # ===========================
@@ -151,44 +154,68 @@ def test_narrative_context_to_prompt_string(sample_stats, sample_awards):
     assert "marathon_coder" in prompt_string
 
 
-# ===========================
-# Tests - Insights Generation
-# ===========================
+def test_narrative_context_is_frozen(sample_stats, sample_awards):
+    """Compiled context cannot be mutated after the fact."""
+    import dataclasses
 
+    context = compile_narrative_context(sample_stats, sample_awards)
 
-def test_generate_insights_no_api_key(sample_stats, sample_awards):
-    """Test graceful handling when no API key available."""
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        context.year = 2030
+
+
+def test_narrative_context_calendar_patterns(sample_stats, sample_awards):
+    """Weekend share and busiest month match with and without raw sessions."""
     context = compile_narrative_context(sample_stats, sample_awards)
 
-    with patch("code_wrapped.narrative.insights._check_api_key", return_value=None):
-        insights = generate_insights(context)
+    assert context.weekend_percentage == 0.0  # All sample sessions on weekdays
+    assert context.busiest_month == "January"
 
-    assert insights is None
+    # Reloaded stats only have daily_sessions; the fallback must agree
+    reloaded = WrappedStats(
+        year=2025,
+        generated_at=sample_stats.generated_at,
+        total_sessions=sample_stats.total_sessions,
+        daily_sessions={**sample_stats.daily_sessions, "2025-03-22": 2},  # + a Saturday
+    )
+    reloaded_context = compile_narrative_context(reloaded, sample_awards)
 
+    assert reloaded_context.weekend_percentage == 40.0
+    assert reloaded_context.busiest_month == "March"
 
-def test_generate_insights_no_anthropic_package(sample_stats, sample_awards):
-    """Test graceful handling when anthropic package not installed."""
-    context = compile_narrative_context(sample_stats, sample_awards)
 
-    # Mock the import to raise ImportError
-    with patch("code_wrapped.narrative.insights._check_api_key", return_value="test-key"):
-        with patch("builtins.__import__", side_effect=lambda name, *args, **kwargs:
-                   (_ for _ in ()).throw(ImportError()) if name == "anthropic" else __import__(name, *args, **kwargs)):
-            insights = generate_insights(context)
+def test_narrative_context_longest_session_tie_uses_agent_order(sample_sessions, sample_awards):
+    """On a tie for longest session, the first agent in agent order wins."""
+    started = sample_sessions[0].started_at
+    sessions = (
+        Session(
+            id="gemini-long",
+            agent=AgentType.GEMINI,
+            started_at=started,
+            duration_minutes=90.0,
+        ),
+        Session(
+            id="claude-long",
+            agent=AgentType.CLAUDE,
+            started_at=started.replace(day=16),
+            duration_minutes=90.0,
+            user_prompts=["Migrate the billing service"],
+        ),
+    )
+    stats = aggregate_stats(sessions, 2025)
 
-    # Should return None when import fails
-    assert insights is None
+    context = compile_narrative_context(stats, sample_awards)
 
+    assert context.longest_session_hours == 1.5
+    assert context.longest_session_topic == "Migrate the billing service"
 
-def test_generate_insights_with_mock_api(sample_stats, sample_awards):
-    """Test insights generation with mocked Anthropic API."""
-    context = compile_narrative_context(sample_stats, sample_awards)
 
-    # Mock API response
-    mock_response = Mock()
-    mock_response.content = [
-        Mock(
-            text="""HEADLINE:
+# ===========================
+# Tests - Insights Generation
+# ===========================
+
+
+CANNED_NARRATIVE = """HEADLINE:
 You had 3 epic coding sessions in 2025
 
 YEAR_SUMMARY:
@@ -205,20 +232,48 @@ You crushed 188 conversation turns across just 3 sessions. When you code, you go
 
 PERSONAL_NOTE:
 Here's to another year of late-night breakthroughs and creative solutions. Your AI partners are ready when you are."""
-        )
-    ]
 
-    # Mock Anthropic client
+
+def _mock_anthropic(text: str | None = None, error: Exception | None = None) -> Mock:
+    """Build a stand-in ``anthropic`` module whose client returns ``text`` or raises ``error``."""
     mock_client = Mock()
-    mock_client.messages.create.return_value = mock_response
+    if error is not None:
+        mock_client.messages.create.side_effect = error
+    else:
+        mock_client.messages.create.return_value = Mock(content=[Mock(text=text)])
 
-    # Mock anthropic module
     mock_anthropic = Mock()
     mock_anthropic.Anthropic.return_value = mock_client
+    return mock_anthropic
+
+
+def test_generate_insights_no_api_key(sample_stats, sample_awards):
+    """Test graceful handling when no API key available."""
+    context = compile_narrative_context(sample_stats, sample_awards)
+
+    insights = generate_insights(context, api_key_fn=lambda: None)
+
+    assert insights is None
+
+
+def test_generate_insights_no_anthropic_package(sample_stats, sample_awards, monkeypatch):
+    """Test graceful handling when anthropic package not installed."""
+    context = compile_narrative_context(sample_stats, sample_awards)
+
+    # A None entry in sys.modules makes "import anthropic" raise ImportError
+    monkeypatch.setitem(sys.modules, "anthropic", None)
+    insights = generate_insights(context, api_key_fn=lambda: "test-key")
+
+    # Should return None when import fails
+    assert insights is None
+
+
+def test_generate_insights_with_mock_api(sample_stats, sample_awards, monkeypatch):
+    """Test insights generation with mocked Anthropic API."""
+    context = compile_narrative_context(sample_stats, sample_awards)
 
-    with patch("code_wrapped.narrative.insights._check_api_key", return_value="test-key"):
-        with patch.dict("sys.modules", {"anthropic": mock_anthropic}):
-            insights = generate_insights(context)
+    monkeypatch.setitem(sys.modules, "anthropic", _mock_anthropic(text=CANNED_NARRATIVE))
+    insights = generate_insights(context, api_key_fn=lambda: "test-key")
 
     assert insights is not None
     assert "3 epic coding sessions" in insights.headline
@@ -229,21 +284,12 @@ Here's to another year of late-night breakthroughs and creative solutions. Your
     assert "late-night breakthroughs" in insights.personal_note
 
 
-def test_generate_insights_api_error(sample_stats, sample_awards):
+def test_generate_insights_api_error(sample_stats, sample_awards, monkeypatch):
     """Test graceful handling of API errors."""
     context = compile_narrative_context(sample_stats, sample_awards)
 
-    # Mock client that raises an error
-    mock_client = Mock()
-    mock_client.messages.create.side_effect = Exception("API Error")
-
-    # Mock anthropic module
-    mock_anthropic = Mock()
-    mock_anthropic.Anthropic.return_value = mock_client
-
-    with patch("code_wrapped.narrative.insights._check_api_key", return_value="test-key"):
-        with patch.dict("sys.modules", {"anthropic": mock_anthropic}):
-            insights = generate_insights(context)
+    monkeypatch.setitem(sys.modules, "anthropic", _mock_anthropic(error=Exception("API Error")))
+    insights = generate_insights(context, api_key_fn=lambda: "test-key")
 
     # Should return None on error
     assert insights is None
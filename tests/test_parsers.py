@@ -1,16 +1,23 @@
 """Tests for session parsers."""
 
+import sys
+
 import pytest
 from pathlib import Path
 from datetime import datetime, timezone
 
 from code_wrapped.parsers.base import (
+    count_tools,
     extract_repo_from_path,
+    find_session_files,
+    iter_file_lines,
     sanitize_prompt,
     parse_iso_timestamp,
 )
-from code_wrapped.parsers.claude import parse_claude_sessions
+from code_wrapped.parsers.claude import parse_claude_sessions, summarize_messages
 from code_wrapped.parsers.codex import parse_codex_sessions
+from code_wrapped.parsers.cursor import parse_cursor_sessions
+from code_wrapped.parsers.gemini import parse_gemini_sessions
 
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -33,10 +40,28 @@ class TestExtractRepoFromPath:
         home = os.path.expanduser("~")
         assert extract_repo_from_path(home) == "~"
 
+    def test_home_directory_follows_home_env(self, tmp_path, monkeypatch):
+        """Home is resolved per call, so a changed HOME is picked up."""
+        from code_wrapped.parsers.claude import get_claude_sessions_dir
+
+        monkeypatch.setenv("HOME", str(tmp_path))
+        assert extract_repo_from_path(str(tmp_path)) == "~"
+        assert get_claude_sessions_dir() == tmp_path / ".claude" / "projects"
+
     def test_no_git_fallback(self):
         """Without git in path, return last directory name."""
         assert extract_repo_from_path("/some/random/path/project") == "project"
 
+    def test_marker_priority(self):
+        """'git' wins over other markers regardless of position."""
+        assert extract_repo_from_path("/home/me/src/git/tool") == "tool"
+        assert extract_repo_from_path("/home/me/code/projects/app") == "app"
+
+    def test_trailing_marker_falls_through(self):
+        """A marker with nothing after it is skipped."""
+        assert extract_repo_from_path("/home/me/projects/foo/git") == "foo/git"
+        assert extract_repo_from_path("/home/me/git/") == "git"
+
     def test_none_input(self):
         assert extract_repo_from_path(None) is None
 
@@ -68,6 +93,31 @@ class TestSanitizePrompt:
         result = sanitize_prompt(prompt)
         assert "/Users/dave" not in result
 
+    def test_redacts_linux_paths_and_keeps_filename(self):
+        result = sanitize_prompt("Read /home/dave/git/project/secrets.txt")
+        assert result == "Read secrets.txt"
+
+    def test_redacts_mixed_secrets(self):
+        prompt = "PASSWORD: hunter2 and ghp_" + "a" * 36 + " api_key=abc"
+        result = sanitize_prompt(prompt)
+        assert "hunter2" not in result
+        assert "ghp_" not in result
+        assert "abc" not in result
+        assert result.count("[REDACTED]") == 3
+
+
+class TestCountTools:
+    """Tests for count_tools function."""
+
+    def test_counts_and_interns_names(self):
+        names = ["".join(["Ba", "sh"]), "Edit", "".join(["Ba", "sh"])]
+        counts = count_tools(names)
+        assert counts == {"Bash": 2, "Edit": 1}
+        assert next(iter(counts)) is sys.intern("Bash")
+
+    def test_empty(self):
+        assert count_tools([]) == {}
+
 
 class TestParseIsoTimestamp:
     """Tests for parse_iso_timestamp function."""
@@ -78,6 +128,10 @@ class TestParseIsoTimestamp:
         assert result.year == 2025
         assert result.month == 6
 
+    def test_z_suffix_is_utc(self):
+        result = parse_iso_timestamp("2025-06-15T14:00:00.123456Z")
+        assert result == datetime(2025, 6, 15, 14, 0, 0, 123456, tzinfo=timezone.utc)
+
     def test_parses_timezone_offset(self):
         result = parse_iso_timestamp("2025-06-15T14:00:00+00:00")
         assert result is not None
@@ -88,6 +142,101 @@ class TestParseIsoTimestamp:
     def test_invalid_format(self):
         assert parse_iso_timestamp("not a date") is None
 
+    def test_repeated_timestamp_is_cached(self):
+        first = parse_iso_timestamp("2025-06-15T14:00:00.000Z")
+        assert parse_iso_timestamp("2025-06-15T14:00:00.000Z") is first
+
+    def test_uncached_parse_matches(self):
+        ts = "2025-06-15T14:00:00.000Z"
+        assert parse_iso_timestamp(ts, cache=False) == parse_iso_timestamp(ts)
+        assert parse_iso_timestamp("not a date", cache=False) is None
+
+
+class TestFindSessionFiles:
+    """Tests for layout-aware session discovery."""
+
+    def test_uses_layout_pattern(self, tmp_path):
+        (tmp_path / "proj").mkdir()
+        (tmp_path / "proj" / "a.jsonl").write_text("{}")
+        (tmp_path / "proj" / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "proj" / "node_modules" / "pkg" / "b.jsonl").write_text("{}")
+
+        files = find_session_files(tmp_path, ("*/*.jsonl",), "*.jsonl")
+        assert [f.name for f in files] == ["a.jsonl"]
+
+    def test_multi_level_layout(self, tmp_path):
+        """Codex-style dated layout plus legacy top-level files."""
+        day = tmp_path / "2025" / "06" / "15"
+        day.mkdir(parents=True)
+        (day / "rollout.jsonl").write_text("{}")
+        (tmp_path / "legacy.json").write_text("{}")
+        (tmp_path / "dir.json").mkdir()  # Directories never match
+
+        files = find_session_files(tmp_path, ("*.json*", "*/*/*/*.json*"), "*.json*")
+        assert sorted(f.name for f in files) == ["legacy.json", "rollout.jsonl"]
+
+    def test_falls_back_to_recursive_search(self, tmp_path):
+        (tmp_path / "x" / "y" / "z").mkdir(parents=True)
+        (tmp_path / "x" / "y" / "z" / "deep.jsonl").write_text("{}")
+
+        files = find_session_files(tmp_path, ("*/*.jsonl",), "*.jsonl")
+        assert [f.name for f in files] == ["deep.jsonl"]
+
+    def test_skips_files_modified_before_cutoff(self, tmp_path):
+        import os
+
+        (tmp_path / "proj").mkdir()
+        old = tmp_path / "proj" / "old.jsonl"
+        old.write_text("{}")
+        (tmp_path / "proj" / "new.jsonl").write_text("{}")
+        stamp = datetime(2024, 6, 1, tzinfo=timezone.utc).timestamp()
+        os.utime(old, (stamp, stamp))
+
+        cutoff = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        files = find_session_files(tmp_path, ("*/*.jsonl",), "*.jsonl", modified_after=cutoff)
+        assert [f.name for f in files] == ["new.jsonl"]
+
+
+class TestIterFileLines:
+    """Tests for iter_file_lines function."""
+
+    def test_small_file(self, tmp_path):
+        path = tmp_path / "s.jsonl"
+        path.write_bytes(b'{"a": 1}\n{"b": 2}')
+        assert list(iter_file_lines(path)) == [b'{"a": 1}\n', b'{"b": 2}']
+
+    def test_mmap_matches_buffered_read(self, tmp_path, monkeypatch):
+        from code_wrapped.parsers import base
+
+        path = tmp_path / "s.jsonl"
+        path.write_bytes(b"line one\n\nline three\n")
+        buffered = list(iter_file_lines(path))
+
+        monkeypatch.setattr(base, "MMAP_MIN_BYTES", 1)
+        assert list(iter_file_lines(path)) == buffered == [b"line one\n", b"\n", b"line three\n"]
+
+
+class TestLoadsLines:
+    """Tests for jsonio.loads_lines."""
+
+    def test_batch(self):
+        from code_wrapped.jsonio import loads_lines
+
+        assert loads_lines([b'{"a": 1}\n', b'{"b": 2}']) == [{"a": 1}, {"b": 2}]
+        assert loads_lines([]) == []
+
+    def test_skips_blank_and_malformed_lines(self):
+        from code_wrapped.jsonio import loads_lines
+
+        lines = [b'{"a": 1}\n', b"\n", b"not json\n", b'{"b": 2}']
+        assert loads_lines(lines) == [{"a": 1}, {"b": 2}]
+
+    def test_line_with_several_values_is_malformed(self):
+        """A line holding two comma-separated objects is not two records."""
+        from code_wrapped.jsonio import loads_lines
+
+        assert loads_lines([b'{"a": 1},{"b": 2}\n', b'{"c": 3}']) == [{"c": 3}]
+
 
 class TestClaudeParser:
     """Tests for Claude session parser."""
@@ -104,6 +253,83 @@ class TestClaudeParser:
         assert session.branch == "main"
 
 
+    def test_metadata_from_later_lines(self, tmp_path):
+        """Metadata missing on the first line is picked up from later lines."""
+        project = tmp_path / "-Users-test-git-late-meta"
+        project.mkdir()
+        (project / "late.jsonl").write_text(
+            '{"type":"summary","summary":"Earlier work","cwd":null}\n'
+            "not json\n"
+            '{"type":"user","cwd":"/Users/test/git/late-meta","sessionId":"late-1",'
+            '"timestamp":"2025-06-15T14:00:00.000Z","message":{"content":"hi"}}\n'
+        )
+
+        sessions = list(parse_claude_sessions(tmp_path))
+        assert len(sessions) == 1
+        assert sessions[0].id == "late-1"
+        assert sessions[0].repo == "late-meta"
+        assert sessions[0].turn_count == 2  # Malformed line skipped
+        assert sessions[0].branch is None
+
+    def test_decodes_across_batches_with_truncated_tail(self, tmp_path, monkeypatch):
+        from code_wrapped.parsers import claude
+
+        monkeypatch.setattr(claude, "DECODE_BATCH_LINES", 2)
+        project = tmp_path / "-Users-test-git-batched"
+        project.mkdir()
+        line = (
+            '{"type":"user","cwd":"/Users/test/git/batched","sessionId":"b-1",'
+            '"timestamp":"2025-06-15T14:00:00.000Z","message":{"content":"hi"}}\n'
+        )
+        (project / "b.jsonl").write_text(line * 3 + "\n" + '{"type":"assist')
+
+        sessions = list(parse_claude_sessions(tmp_path))
+        assert len(sessions) == 1
+        assert sessions[0].turn_count == 3
+        assert sessions[0].user_message_count == 3
+
+
+class TestSummarizeMessages:
+    """Tests for the fused Claude message pass."""
+
+    def test_collects_everything_in_one_pass(self):
+        messages = [
+            {"type": "user", "timestamp": "t1", "message": {"content": "Fix the bug"}},
+            {
+                "type": "assistant",
+                "timestamp": "t2",
+                "message": {
+                    "content": [{"type": "tool_use", "name": "Bash"}],
+                    "usage": {"input_tokens": 10, "cache_read_input_tokens": 5, "output_tokens": 3},
+                },
+            },
+            {
+                "type": "user",
+                "message": {
+                    "content": [
+                        {"type": "tool_result", "is_error": True, "content": "boom"},
+                        "follow-up",
+                    ]
+                },
+                "toolUseResult": {"stderr": "stderr text"},
+            },
+        ]
+
+        summary = summarize_messages(messages)
+
+        assert summary.user_count == 2
+        assert summary.assistant_count == 1
+        assert summary.token_count == 18
+        assert summary.tools == {"Bash": 1}
+        assert summary.prompts == ["Fix the bug", "follow-up"]
+        assert summary.errors == ["boom", "stderr text"]
+        assert summary.last_timestamp == "t2"
+
+    def test_no_usage_means_no_token_count(self):
+        summary = summarize_messages([{"type": "assistant", "message": {"content": []}}])
+        assert summary.token_count is None
+
+
 class TestCodexParser:
     """Tests for Codex session parser."""
 
@@ -116,3 +342,166 @@ class TestCodexParser:
         assert session.repo == "another-project"
         assert session.turn_count == 4  # 4 items
         assert session.tools_used.get("shell") == 1
+        assert session.user_message_count == 2
+        assert session.assistant_message_count == 1
+        assert session.user_prompts == ["Add a feature", "Thanks"]
+        assert session.prompt_text == "add a feature thanks"
+
+    def test_parses_rollout_jsonl(self, tmp_path):
+        import json
+
+        day = tmp_path / "2025" / "06" / "15"
+        day.mkdir(parents=True)
+        lines = [
+            {
+                "type": "session_meta",
+                "timestamp": "2025-06-15T15:00:00Z",
+                "payload": {"id": "rollout-1", "cwd": "/Users/test/git/rollout"},
+            },
+            {
+                "type": "response_item",
+                "timestamp": "2025-06-15T15:01:00Z",
+                "payload": {"role": "user", "content": [{"type": "input_text", "text": "Go"}]},
+            },
+            {
+                "type": "response_item",
+                "timestamp": "2025-06-15T15:02:00Z",
+                "payload": {"type": "function_call", "name": "shell"},
+            },
+            {"type": "response_item", "payload": {"role": "assistant", "content": []}},
+            {"type": "event_msg", "timestamp": "2025-06-15T15:10:00Z", "payload": None},
+        ]
+        (day / "rollout.jsonl").write_text("\n".join(json.dumps(line) for line in lines))
+
+        sessions = list(parse_codex_sessions(tmp_path, year=2025))
+
+        assert len(sessions) == 1
+        session = sessions[0]
+        assert session.id == "rollout-1"
+        assert session.repo == "rollout"
+        assert session.turn_count == 5
+        assert session.user_message_count == 1
+        assert session.assistant_message_count == 1
+        assert session.tools_used == {"shell": 1}
+        assert session.user_prompts == ["Go"]
+        assert session.duration_minutes == 10
+
+
+class TestCursorParser:
+    """Tests for Cursor SQLite parser."""
+
+    def test_parses_composers_with_bubble_counts(self, tmp_path):
+        import json
+        import sqlite3
+
+        db_path = tmp_path / "state.vscdb"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE cursorDiskKV (key TEXT PRIMARY KEY, value BLOB)")
+        created = int(datetime(2025, 6, 15, 14, 0, tzinfo=timezone.utc).timestamp() * 1000)
+        rows = [
+            ("composerData:c1", json.dumps({"createdAt": created, "unifiedMode": "agent"})),
+            ("composerData:c2", json.dumps({"createdAt": created})),
+            ("composerData:old", json.dumps({"createdAt": 1000})),  # 1970
+            ("bubbleId:c1:b1", "{}"),
+            ("bubbleId:c1:b2", "{}"),
+            ("bubbleId:c1:b3", "{}"),
+            ("bubbleId:c2", "{}"),
+        ]
+        conn.executemany("INSERT INTO cursorDiskKV VALUES (?, ?)", rows)
+        conn.commit()
+        conn.close()
+
+        sessions = {s.id: s for s in parse_cursor_sessions(db_path, year=2025)}
+
+        assert set(sessions) == {"c1", "c2"}
+        assert sessions["c1"].turn_count == 3
+        assert sessions["c1"].tools_used == {"cursor_mode": 1}
+        assert sessions["c2"].turn_count == 1
+        assert sessions["c2"].tools_used == {}
+
+    def test_opens_database_read_only(self, tmp_path):
+        import sqlite3
+
+        # Path with a space, like "Application Support" on macOS
+        db_dir = tmp_path / "Application Support"
+        db_dir.mkdir()
+        db_path = db_dir / "state.vscdb"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE cursorDiskKV (key TEXT PRIMARY KEY, value BLOB)")
+        conn.execute(
+            "INSERT INTO cursorDiskKV VALUES (?, ?)", ("composerData:c1", '{"createdAt": 1000}')
+        )
+        conn.commit()
+        conn.close()
+
+        assert [s.id for s in parse_cursor_sessions(db_path)] == ["c1"]
+        # No journal or lock files left behind
+        assert sorted(p.name for p in db_dir.iterdir()) == ["state.vscdb"]
+
+
+class TestGeminiParser:
+    """Tests for Gemini logs.json parser."""
+
+    def _write_logs(self, tmp_path, messages):
+        import json
+
+        project_dir = tmp_path / "abc123"
+        project_dir.mkdir()
+        (project_dir / "logs.json").write_text(json.dumps(messages))
+
+    def _msg(self, session_id, msg_type, timestamp, content=None):
+        msg = {"sessionId": session_id, "type": msg_type, "timestamp": timestamp}
+        if content is not None:
+            msg["content"] = content
+        return msg
+
+    def test_groups_messages_by_session(self, tmp_path):
+        self._write_logs(
+            tmp_path,
+            [
+                self._msg("g1", "user", "2025-03-01T10:00:00Z", "hi"),
+                self._msg("g1", "model", "2025-03-01T10:05:00Z"),
+                self._msg("g2", "user", "2025-03-02T09:00:00Z", "yo"),
+                self._msg("g3", "user", "2024-03-02T09:00:00Z", "old"),
+            ],
+        )
+
+        sessions = {s.id: s for s in parse_gemini_sessions(tmp_path, year=2025)}
+
+        assert set(sessions) == {"g1", "g2"}
+        assert sessions["g1"].turn_count == 2
+        assert sessions["g1"].user_message_count == 1
+        assert sessions["g1"].assistant_message_count == 1
+        assert sessions["g1"].duration_minutes == 5
+        assert sessions["g2"].user_prompts == ["yo"]
+
+    def test_tracks_bounds_of_unordered_messages(self, tmp_path):
+        self._write_logs(
+            tmp_path,
+            [
+                self._msg("g1", "user", "2025-03-01T10:05:00Z", "second"),
+                self._msg("g1", "user", "2025-03-01T10:00:00Z", "first"),
+                self._msg("g1", "model", "2025-03-01T10:20:00Z"),
+            ],
+        )
+
+        (session,) = parse_gemini_sessions(tmp_path)
+
+        assert session.started_at == datetime(2025, 3, 1, 10, 0, tzinfo=timezone.utc)
+        assert session.duration_minutes == 20
+        assert session.user_prompts == ["second", "first"]
+
+    def test_without_streaming_parser(self, tmp_path, monkeypatch):
+        from code_wrapped import jsonio
+
+        monkeypatch.setattr(jsonio, "ijson", None)
+        self._write_logs(tmp_path, [self._msg("g1", "user", "2025-03-01T10:00:00Z", "hi")])
+
+        sessions = list(parse_gemini_sessions(tmp_path, year=2025))
+
+        assert [s.id for s in sessions] == ["g1"]
+
+    def test_skips_non_array_logs(self, tmp_path):
+        self._write_logs(tmp_path, {"sessionId": "g1"})
+
+        assert list(parse_gemini_sessions(tmp_path)) == []
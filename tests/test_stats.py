@@ -1,10 +1,30 @@
 """Tests for stats aggregation."""
 
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from code_wrapped.parsers.base import AgentType, Session
-from code_wrapped.stats import compute_streaks, aggregate_stats
+from code_wrapped.stats import (
+    AGENT_TYPES,
+    AgentStats,
+    WrappedStats,
+    aggregate_stats,
+    compute_streaks,
+    sort_by_key,
+    top_counts,
+)
+
+STARTED = datetime(2025, 6, 15, 14, 0, tzinfo=timezone.utc)
+
+
+def make_session(
+    session_id: str,
+    agent: AgentType = AgentType.CLAUDE,
+    started_at: datetime = STARTED,
+    **fields,
+) -> Session:
+    """Build a Session with only the fields a test cares about spelled out."""
+    return Session(id=session_id, agent=agent, started_at=started_at, **fields)
 
 
 class TestComputeStreaks:
@@ -52,6 +72,22 @@ class TestComputeStreaks:
         longest, current, active = result
         assert active == 2  # Only 2 active days
 
+    def test_streaks_across_month_and_year_boundaries(self):
+        sessions = {
+            "2024-12-30": 1,
+            "2024-12-31": 1,
+            "2025-01-01": 1,
+            "2025-01-02": 1,
+            "2025-02-27": 1,
+            "2025-02-28": 1,
+            "2025-03-01": 1,
+        }
+        assert compute_streaks(sessions) == (4, 3, 7)
+
+    def test_unordered_input(self):
+        sessions = {"2025-06-20": 1, "2025-06-15": 1, "2025-06-16": 1}
+        assert compute_streaks(sessions) == (2, 1, 3)
+
 
 class TestAggregateStats:
     """Tests for stats aggregation."""
@@ -83,16 +119,11 @@ class TestAggregateStats:
 
     def test_multiple_agents(self):
         sessions = [
-            Session(
-                id="claude-1",
-                agent=AgentType.CLAUDE,
-                started_at=datetime(2025, 6, 15, 14, 0, tzinfo=timezone.utc),
-                turn_count=10,
-            ),
-            Session(
-                id="codex-1",
-                agent=AgentType.CODEX,
-                started_at=datetime(2025, 6, 15, 15, 0, tzinfo=timezone.utc),
+            make_session("claude-1", turn_count=10),
+            make_session(
+                "codex-1",
+                AgentType.CODEX,
+                datetime(2025, 6, 15, 15, 0, tzinfo=timezone.utc),
                 turn_count=20,
             ),
         ]
@@ -104,30 +135,210 @@ class TestAggregateStats:
         assert stats.agent_stats[AgentType.CLAUDE].session_count == 1
         assert stats.agent_stats[AgentType.CODEX].session_count == 1
 
+    def test_distributions_merge_across_sessions(self):
+        sessions = [
+            make_session("a", repo="proj", tools_used={"Bash": 3, "Edit": 1}),
+            make_session("b", repo="proj", tools_used={"Bash": 2}),
+            make_session("c", AgentType.CODEX, repo="other", tools_used={"shell": 4}),
+        ]
+
+        stats = aggregate_stats(sessions, 2025)
+
+        assert stats.all_repos == {"proj": 2, "other": 1}
+        assert stats.all_tools == {"Bash": 5, "Edit": 1, "shell": 4}
+        assert stats.agent_stats[AgentType.CLAUDE].tools_used == {"Bash": 5, "Edit": 1}
+        assert stats.agent_stats[AgentType.CODEX].repos == {"other": 1}
+        assert stats.daily_sessions == {"2025-06-15": 3}
+        assert stats.all_repos["never-seen"] == 0
+
+    def test_errors_counted_with_first_session(self):
+        sessions = [
+            make_session("a", errors=["boom"]),
+            make_session("b", errors=["oops", "boom"]),
+            make_session("c", AgentType.CODEX),
+        ]
+
+        stats = aggregate_stats(sessions, 2025)
+
+        assert stats.error_counts.most_common(1) == [("boom", 2)]
+        assert stats.error_counts["oops"] == 1
+        assert stats.error_sessions == {"boom": "a", "oops": "b"}
+
+    def test_sessions_shared_not_copied(self):
+        sessions = [make_session("secret-session")]
+
+        stats = aggregate_stats(sessions, 2025)
+
+        assert stats.sessions is sessions
+        assert "secret-session" not in repr(stats)
+
     def test_hour_distribution(self):
+        sessions = [
+            make_session(session_id, started_at=started_at, turn_count=5)
+            for session_id, started_at in [
+                ("morning", datetime(2025, 6, 15, 9, 0, tzinfo=timezone.utc)),
+                ("evening", datetime(2025, 6, 15, 21, 0, tzinfo=timezone.utc)),
+                ("evening2", datetime(2025, 6, 16, 21, 0, tzinfo=timezone.utc)),
+            ]
+        ]
+
+        stats = aggregate_stats(sessions, 2025)
+
+        assert stats.hours_distribution[9] == 1
+        assert stats.hours_distribution[21] == 2
+        assert stats.peak_hour == 21
+
+    def test_session_columns(self):
         sessions = [
             Session(
-                id="morning",
+                id="short",
                 agent=AgentType.CLAUDE,
-                started_at=datetime(2025, 6, 15, 9, 0, tzinfo=timezone.utc),
+                started_at=datetime(2025, 6, 14, 9, 0, tzinfo=timezone.utc),
+                ended_at=datetime(2025, 6, 14, 9, 30, tzinfo=timezone.utc),
                 turn_count=5,
             ),
             Session(
-                id="evening",
-                agent=AgentType.CLAUDE,
-                started_at=datetime(2025, 6, 15, 21, 0, tzinfo=timezone.utc),
-                turn_count=5,
+                id="long",
+                agent=AgentType.CODEX,
+                started_at=datetime(2025, 6, 16, 21, 0, tzinfo=timezone.utc),
+                ended_at=datetime(2025, 6, 16, 23, 0, tzinfo=timezone.utc),
+                turn_count=40,
             ),
+        ]
+
+        columns = aggregate_stats(sessions, 2025).columns
+
+        assert columns.duration_minutes.tolist() == [30.0, 120.0]
+        assert columns.turn_count.tolist() == [5, 40]
+        assert columns.hour_of_day.tolist() == [9, 21]
+        assert columns.day_of_week.tolist() == [5, 0]  # Saturday, Monday
+        assert sessions[int(columns.duration_minutes.argmax())].id == "long"
+
+    def test_session_columns_counts_and_dates(self):
+        sessions = [
             Session(
-                id="evening2",
+                id="a",
+                agent=AgentType.CODEX,
+                started_at=datetime(2025, 6, 14, 23, 30, tzinfo=timezone.utc),
+                user_message_count=2,
+                assistant_message_count=3,
+                token_count=None,
+            ),
+            Session(
+                id="b",
                 agent=AgentType.CLAUDE,
-                started_at=datetime(2025, 6, 16, 21, 0, tzinfo=timezone.utc),
-                turn_count=5,
+                started_at=datetime(2025, 6, 16, 8, 0, tzinfo=timezone.utc),
+                token_count=500,
             ),
         ]
 
+        columns = aggregate_stats(sessions, 2025).columns
+
+        assert [AGENT_TYPES[i] for i in columns.agent] == [AgentType.CODEX, AgentType.CLAUDE]
+        assert columns.user_message_count.tolist() == [2, 0]
+        assert columns.assistant_message_count.tolist() == [3, 0]
+        assert columns.token_count.tolist() == [0, 500]
+        assert columns.date_ordinal.tolist() == [
+            datetime(2025, 6, 14).toordinal(),
+            datetime(2025, 6, 16).toordinal(),
+        ]
+
+    def test_records_keep_first_session_on_ties(self):
+        sessions = [
+            make_session(
+                session_id, ended_at=STARTED + timedelta(minutes=minutes), turn_count=turns
+            )
+            for session_id, minutes, turns in [("a", 10, 3), ("b", 45, 9), ("c", 45, 9)]
+        ]
+
+        agent = aggregate_stats(sessions, 2025).agent_stats[AgentType.CLAUDE]
+
+        assert agent.longest_session_minutes == 45
+        assert agent.longest_session_id == "b"
+        assert agent.most_turns_session == 9
+        assert agent.most_turns_session_id == "b"
+        assert agent.total_duration_minutes == 100
+
+    def test_zero_records_stay_unset(self):
+        sessions = [make_session("a", AgentType.CURSOR)]
+
+        agent = aggregate_stats(sessions, 2025).agent_stats[AgentType.CURSOR]
+
+        assert agent.longest_session_id is None
+        assert agent.most_turns_session_id is None
+
+    def test_session_columns_empty(self):
+        columns = aggregate_stats([], 2025).columns
+        assert len(columns.duration_minutes) == 0
+
+
+class TestToDict:
+    """Tests for WrappedStats.to_dict."""
+
+    def test_top_n_distributions(self):
+        tools = {f"tool{i}": i for i in range(20)}
+        tools["tie"] = 19  # Ties keep first-seen order
+        stats = WrappedStats(
+            year=2025,
+            generated_at=datetime(2025, 12, 31),
+            all_tools=tools,
+            all_repos={"a": 1, "b": 3, "c": 2},
+            agent_stats={
+                AgentType.CLAUDE: AgentStats(
+                    agent=AgentType.CLAUDE,
+                    repos={f"r{i}": i for i in range(8)},
+                    tools_used=tools,
+                )
+            },
+        )
+
+        data = stats.to_dict()
+
+        by_tool = list(data["distributions"]["by_tool"])
+        assert len(by_tool) == 15
+        assert by_tool[:3] == ["tool19", "tie", "tool18"]
+        assert list(data["distributions"]["by_repo"].items()) == [("b", 3), ("c", 2), ("a", 1)]
+        claude = data["agents"]["claude"]
+        assert list(claude["top_repos"]) == ["r7", "r6", "r5", "r4", "r3"]
+        assert len(claude["top_tools"]) == 10
+
+    def test_empty_agent_distributions(self):
+        stats = WrappedStats(
+            year=2025,
+            generated_at=datetime(2025, 12, 31),
+            agent_stats={AgentType.CURSOR: AgentStats(agent=AgentType.CURSOR)},
+        )
+
+        agent = stats.to_dict()["agents"]["cursor"]
+
+        assert agent["top_repos"] == {}
+        assert agent["top_tools"] == {}
+        assert top_counts({}, 5) == {}
+
+    def test_distributions_sorted_by_key(self):
+        stats = WrappedStats(
+            year=2025,
+            generated_at=datetime(2025, 12, 31),
+            hours_distribution={21: 2, 9: 1, 14: 5},
+            daily_sessions={"2025-06-16": 1, "2025-01-02": 4, "2025-06-15": 2},
+        )
+
+        distributions = stats.to_dict()["distributions"]
+
+        assert list(distributions["by_hour"].items()) == [(9, 1), (14, 5), (21, 2)]
+        assert list(distributions["by_day"]) == ["2025-01-02", "2025-06-15", "2025-06-16"]
+        assert sort_by_key({}) == {}
+
+    def test_enrichment_computed_once(self, monkeypatch):
+        sessions = [make_session("a", user_prompts=["fix the failing test"])]
         stats = aggregate_stats(sessions, 2025)
+        calls = []
+        compute = WrappedStats._compute_enrichment
+        monkeypatch.setattr(
+            WrappedStats, "_compute_enrichment", lambda self: calls.append(1) or compute(self)
+        )
 
-        assert stats.hours_distribution[9] == 1
-        assert stats.hours_distribution[21] == 2
-        assert stats.peak_hour == 21
+        first = stats.to_dict()["enrichment"]
+        assert stats.to_dict()["enrichment"] is first
+        assert stats.enrichment is first
+        assert len(calls) == 1
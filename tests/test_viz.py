@@ -1,5 +1,6 @@
 """Tests for visualization modules."""
 
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
 
@@ -13,17 +14,25 @@ from code_wrapped.viz.charts import (
     generate_all_charts,
     generate_hourly_distribution,
     generate_tool_usage_chart,
+    save_all_charts,
 )
 from code_wrapped.viz.cards import (
     generate_agent_comparison_card,
     generate_all_cards,
+    generate_award_card,
     generate_hero_card,
+    get_font,
+    hex_to_rgb,
+    text_width,
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_stats() -> WrappedStats:
-    """Create sample stats for testing."""
+    """Create sample stats for testing.
+
+    Module-scoped: the charts and cards tests all share it, so treat it as read-only.
+    """
     stats = WrappedStats(
         year=2025,
         generated_at=datetime.now(),
@@ -68,7 +77,7 @@ def sample_stats() -> WrappedStats:
     return stats
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_enrichment() -> dict:
     """Create sample enrichment data."""
     return {
@@ -114,12 +123,52 @@ class TestCharts:
         assert len(fig.data) == 1
         assert 'heatmap' in fig.data[0].type.lower()
 
+    def test_activity_heatmap_values(self, sample_stats):
+        """Each weekday's sessions are spread over the hour distribution."""
+        fig = generate_activity_heatmap(sample_stats)
+        z = [list(row) for row in fig.data[0].z]
+
+        # 2025-01-01..03 are Wed, Thu, Fri (Sunday=0 rows 3, 4, 5); 15/70 at 10:00
+        assert len(z) == 7 and all(len(row) == 24 for row in z)
+        assert z[3][10] == pytest.approx(5 * 15 / 70)
+        assert z[4][10] == pytest.approx(8 * 15 / 70)
+        assert z[5][11] == pytest.approx(6 * 20 / 70)
+        assert z[0] == [0] * 24
+        assert z[3][0] == 0
+
+    def test_activity_heatmap_serializes_as_lists(self, sample_stats):
+        """The grid is plain lists, so it JSON-encodes on plotly 5.x as well."""
+        import json
+
+        fig = generate_activity_heatmap(sample_stats)
+        z = fig.to_dict()['data'][0]['z']
+
+        assert isinstance(z, list) and all(isinstance(row, list) for row in z)
+        json.dumps(z)
+
+    def test_activity_heatmap_skips_malformed_dates(self, sample_stats):
+        """A bad date key is skipped rather than dropping the whole grid."""
+        stats = replace(sample_stats, daily_sessions={'2025-01-05': 4, 'not-a-date': 9})
+        fig = generate_activity_heatmap(stats)
+        z = [list(row) for row in fig.data[0].z]
+
+        # 2025-01-05 was a Sunday
+        assert sum(z[0]) == pytest.approx(4)
+        assert sum(map(sum, z)) == pytest.approx(4)
+
     def test_generate_tool_usage_chart(self, sample_stats):
         """Test tool usage chart generation."""
         fig = generate_tool_usage_chart(sample_stats)
         assert fig is not None
         assert len(fig.data) == 1
         assert fig.layout.title.text == 'Your Tool Fingerprint'
+        # Largest count drawn last, i.e. at the top of the horizontal bars
+        assert list(fig.data[0].y) == ['Write', 'Edit', 'Read', 'Bash']
+
+    def test_generate_tool_usage_chart_top_n(self, sample_stats):
+        fig = generate_tool_usage_chart(sample_stats, top_n=2)
+        assert list(fig.data[0].y) == ['Read', 'Bash']
+        assert list(fig.data[0].x) == [80, 100]
 
     def test_generate_agent_comparison_chart(self, sample_stats):
         """Test agent comparison chart generation."""
@@ -128,6 +177,9 @@ class TestCharts:
         assert len(fig.data) == 1
         # Should be pie chart
         assert hasattr(fig.data[0], 'hole')  # Donut chart
+        assert list(fig.data[0].labels) == ['Claude', 'Codex']
+        assert list(fig.data[0].values) == [60, 40]
+        assert list(fig.data[0].marker.colors) == ['#5436DA', '#10A37F']
 
     def test_generate_all_charts(self, sample_stats, sample_enrichment):
         """Test generating all charts at once."""
@@ -139,6 +191,35 @@ class TestCharts:
         assert 'tools' in charts
         assert 'topics' in charts
 
+    def test_save_all_charts_single_batch(self, sample_stats, tmp_path, monkeypatch):
+        """All figures are exported in one write_images call."""
+        import plotly.io as pio
+
+        calls = []
+
+        def write_images(*args, **kwargs):
+            calls.append((args, kwargs))
+
+        monkeypatch.setattr(pio, 'write_images', write_images)
+
+        charts = {
+            'hourly': generate_hourly_distribution(sample_stats),
+            'tools': generate_tool_usage_chart(sample_stats),
+        }
+        paths = save_all_charts(charts, tmp_path / "charts")
+
+        assert paths == {
+            'hourly': tmp_path / "charts" / "hourly.png",
+            'tools': tmp_path / "charts" / "tools.png",
+        }
+        assert len(calls) == 1
+        (figs, files), kwargs = calls[0]
+        assert figs == list(charts.values())
+        assert files == list(paths.values())
+        # Figures with their own layout height keep it
+        assert kwargs['height'] == [400, 400]
+        assert kwargs['width'] == 1200
+
 
 class TestCards:
     """Test card generation functions."""
@@ -156,6 +237,37 @@ class TestCards:
         assert card is not None
         assert card.size == (1200, 630)
 
+    def test_get_font_cached(self):
+        """Fonts are loaded once per size and weight."""
+        assert get_font(30) is get_font(30)
+        assert get_font(30, bold=True) is get_font(30, bold=True)
+
+    def test_hex_to_rgb(self):
+        """Long, short and unprefixed hex colors all convert."""
+        assert hex_to_rgb('#5436DA') == (84, 54, 218)
+        assert hex_to_rgb('#FFF') == (255, 255, 255)
+        assert hex_to_rgb('10A37F') == (16, 163, 127)
+
+    def test_text_width_matches_textbbox(self):
+        """Cached advance widths agree with ImageDraw's bounding box to a pixel or two."""
+        from PIL import Image, ImageDraw
+
+        draw = ImageDraw.Draw(Image.new('RGB', (10, 10)))
+        font = get_font(24)
+        for text in ('Sessions', 'Code Wrapped 2025', '1,234'):
+            left, _, right, _ = draw.textbbox((0, 0), text, font=font)
+            assert abs(text_width(text, font) - (right - left)) <= 2
+
+    def test_award_card_wraps_long_detail(self):
+        """Long award details wrap onto a second line; short ones don't."""
+        def second_line_drawn(detail: str) -> bool:
+            card = generate_award_card('Night Owl', '🦉', detail, 2025)
+            line_two = card.crop((0, 480, 1200, 520))
+            return len(line_two.getcolors(maxcolors=1200 * 40)) > 1
+
+        assert not second_line_drawn('Peak productivity at 2 AM')
+        assert second_line_drawn('Peak productivity at 2 AM, ' * 4)
+
     def test_generate_all_cards(self, sample_stats, sample_enrichment, tmp_path):
         """Test generating all cards at once."""
         output_dir = tmp_path / "cards"
@@ -196,6 +308,13 @@ class TestOutput:
         assert 'Plotly' in html_content  # Chart library
         assert str(sample_stats.total_sessions) in html_content
 
+    def test_template_compiled_once(self):
+        from code_wrapped.output.report import get_template_env
+
+        env = get_template_env()
+        assert get_template_env() is env
+        assert env.get_template('wrapped.html') is env.get_template('wrapped.html')
+
     def test_generate_full_report(self, sample_stats, sample_enrichment, tmp_path):
         """Test full report generation."""
         from code_wrapped.output.report import generate_full_report
@@ -228,3 +347,23 @@ class TestOutput:
         assert share_data['year'] == 2025
         assert 'summary' in share_data
         assert 'agents' in share_data
+
+    def test_load_wrapped_json_roundtrip(self, sample_stats, tmp_path):
+        """Test reloading stats from a saved wrapped JSON file."""
+        import json
+
+        from code_wrapped.output.report import load_wrapped_json
+
+        data = sample_stats.to_dict()
+        data['agents']['copilot'] = {'sessions': 1, 'turns': 1}  # Unknown agent
+        json_path = tmp_path / "wrapped-2025.json"
+        json_path.write_text(json.dumps(data))
+
+        stats, enrichment = load_wrapped_json(json_path)
+
+        assert stats.year == 2025
+        assert stats.total_sessions == 100
+        assert stats.hours_distribution[11] == 20
+        assert set(stats.agent_stats) == {AgentType.CLAUDE, AgentType.CODEX}
+        assert stats.agent_stats[AgentType.CLAUDE].session_count == 60
+        assert enrichment == {}